@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Recherche spatiale des aéroports
+Interroge l'index R*Tree construit par seed_database.py : aéroports les plus proches,
+dans un rayon ou dans un rectangle, filtrés par taille, ILS et longueur de piste
+Les distances sont orthodromiques, en miles nautiques
+"""
+
+import argparse
+import math
+import sqlite3
+import time
+
+import seed_database
+
+# Rayon moyen de la Terre en miles nautiques
+EARTH_RADIUS_NM = 3440.065
+
+# Demi-circonférence : aucun aéroport ne peut être plus loin
+MAX_DISTANCE_NM = math.pi * EARTH_RADIUS_NM
+
+# Rayon de départ de la recherche des plus proches et facteur d'agrandissement maximal
+NEAREST_START_RADIUS_NM = 50
+NEAREST_GROWTH = 4
+
+# Tailles d'aéroport (colonne Size)
+SIZE_SMALL = 0
+SIZE_MEDIUM = 1
+SIZE_LARGE = 2
+SIZE_INTERNATIONAL = 3
+
+# Requête unique (mise en cache par sqlite3) : les filtres absents valent 0
+# Taille, ILS et piste sont des dimensions de l'arbre, filtrées sans lire les lignes
+BOX_QUERY = f"""
+    SELECT IcaoCode, Latitude, Longitude, MinSize, MinILS, MaxRunwayLength
+    FROM {seed_database.SPATIAL_INDEX}
+    WHERE MaxLat >= ? AND MinLat <= ? AND MaxLon >= ? AND MinLon <= ?
+      AND MaxSize >= ? AND MaxILS >= ? AND MaxRunway >= ?
+"""
+
+def haversine_nm(lat1, lon1, lat2, lon2):
+    """Distance orthodromique entre deux points (degrés) en miles nautiques"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_NM * math.asin(min(1.0, math.sqrt(a)))
+
+def split_antimeridian(south, west, north, east):
+    """Rectangles (sud, ouest, nord, est) couvrant une zone, coupée à l'antiméridien si besoin"""
+    if west <= east:
+        return [(south, west, north, east)]
+    return [(south, west, north, 180.0), (south, -180.0, north, east)]
+
+def radius_boxes(lat, lon, radius_nm):
+    """Rectangles englobant le cercle de rayon radius_nm autour d'un point"""
+    angle = radius_nm / EARTH_RADIUS_NM
+    dlat = math.degrees(angle)
+    south = lat - dlat
+    north = lat + dlat
+    if south <= -90 or north >= 90:
+        # Le cercle contient un pôle : toutes les longitudes
+        return [(max(south, -90.0), -180.0, min(north, 90.0), 180.0)]
+
+    ratio = math.sin(angle) / math.cos(math.radians(lat))
+    if ratio >= 1:
+        return [(south, -180.0, north, 180.0)]
+    dlon = math.degrees(math.asin(ratio))
+    west = (lon - dlon + 180) % 360 - 180
+    east = (lon + dlon + 180) % 360 - 180
+    return split_antimeridian(south, west, north, east)
+
+class AirportIndex:
+    """
+    Requêtes spatiales sur l'index des aéroports
+    Filtres communs : min_size (Size minimale), ils (ILS obligatoire),
+    min_runway (longueur minimale de la plus grande piste, en pieds)
+    Chaque résultat est un dictionnaire icao, latitude, longitude, size, has_ils,
+    max_runway_length (et distance en miles nautiques pour les recherches autour d'un point)
+    """
+
+    def __init__(self, db_path=seed_database.DB_PATH):
+        self._conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Ferme la base"""
+        self._conn.close()
+
+    def _query(self, boxes, min_size, ils, min_runway):
+        """Lignes de l'index dans une liste de rectangles, filtres appliqués"""
+        min_runway = min_runway or 0
+        filters = (min_size or 0, 1 if ils else 0, min_runway / seed_database.SPATIAL_RUNWAY_SCALE)
+        for south, west, north, east in boxes:
+            for icao, lat, lon, size, has_ils, runway in self._conn.execute(
+                    BOX_QUERY, (south, north, west, east) + filters):
+                # L'arbre arrondit vers l'extérieur : contrôle exact de la piste
+                if runway >= min_runway:
+                    yield icao, lat, lon, int(size), bool(has_ils), runway
+
+    def within_bbox(self, south, west, north, east, min_size=None, ils=False, min_runway=None):
+        """
+        Aéroports dans un rectangle de latitudes/longitudes (degrés)
+        Un rectangle dont l'ouest est plus grand que l'est traverse l'antiméridien
+        """
+        results = []
+        for icao, lat, lon, size, has_ils, runway in self._query(
+                split_antimeridian(south, west, north, east), min_size, ils, min_runway):
+            # L'arbre arrondit vers l'extérieur : contrôle exact des coordonnées
+            inside_lon = west <= lon <= east if west <= east else (lon >= west or lon <= east)
+            if south <= lat <= north and inside_lon:
+                results.append({"icao": icao, "latitude": lat, "longitude": lon, "size": size,
+                                "has_ils": has_ils, "max_runway_length": runway})
+        return results
+
+    def within_radius(self, lat, lon, radius_nm, min_size=None, ils=False, min_runway=None):
+        """Aéroports à moins de radius_nm miles nautiques d'un point, du plus proche au plus loin"""
+        results = []
+        for icao, a_lat, a_lon, size, has_ils, runway in self._query(
+                radius_boxes(lat, lon, radius_nm), min_size, ils, min_runway):
+            distance = haversine_nm(lat, lon, a_lat, a_lon)
+            if distance <= radius_nm:
+                results.append({"icao": icao, "latitude": a_lat, "longitude": a_lon, "size": size,
+                                "has_ils": has_ils, "max_runway_length": runway,
+                                "distance": distance})
+        results.sort(key=lambda r: r["distance"])
+        return results
+
+    def nearest(self, lat, lon, k=1, min_size=None, ils=False, min_runway=None):
+        """
+        Les k aéroports les plus proches d'un point
+        Le rayon de recherche est agrandi jusqu'à contenir k aéroports : tout aéroport
+        hors du cercle est plus loin que ceux qu'il contient, le résultat est donc exact
+        L'agrandissement suit la densité observée (surface proportionnelle au nombre
+        d'aéroports manquants) pour ne pas parcourir une zone trop grande
+        """
+        radius = NEAREST_START_RADIUS_NM
+        while True:
+            results = self.within_radius(lat, lon, radius, min_size, ils, min_runway)
+            if len(results) >= k or radius >= MAX_DISTANCE_NM:
+                return results[:k]
+            growth = NEAREST_GROWTH
+            if results:
+                growth = min(growth, 1.2 * math.sqrt(k / len(results)))
+            radius = min(radius * growth, MAX_DISTANCE_NM)
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Recherche des aéroports autour d'un point")
+    parser.add_argument("latitude", type=float)
+    parser.add_argument("longitude", type=float)
+    parser.add_argument("--db", default=seed_database.DB_PATH, help="chemin de la base SQLite")
+    parser.add_argument("-k", type=int, default=5, help="nombre d'aéroports (défaut : 5)")
+    parser.add_argument("--radius", type=float,
+                        help="tous les aéroports dans ce rayon (NM) au lieu des k plus proches")
+    parser.add_argument("--min-size", type=int, help="taille minimale (0 à 3)")
+    parser.add_argument("--ils", action="store_true", help="ILS obligatoire")
+    parser.add_argument("--min-runway", type=int, help="longueur de piste minimale (pieds)")
+    args = parser.parse_args()
+
+    filters = {"min_size": args.min_size, "ils": args.ils, "min_runway": args.min_runway}
+    with AirportIndex(args.db) as index:
+        start = time.perf_counter()
+        if args.radius is not None:
+            results = index.within_radius(args.latitude, args.longitude, args.radius, **filters)
+        else:
+            results = index.nearest(args.latitude, args.longitude, args.k, **filters)
+        elapsed = time.perf_counter() - start
+
+    for r in results:
+        print(f"  • {r['icao']:<6}{r['distance']:>9.1f} NM   taille {r['size']}"
+              f"   ILS {'oui' if r['has_ils'] else 'non'}   piste {r['max_runway_length']} ft")
+    print(f"\n✓ {len(results)} aéroports en {elapsed * 1e6:.0f} µs")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai des noyaux DSP (dsp.py)
+Compare chaque noyau vectorisé à l'implémentation d'origine des scripts de génération :
+vérifie que leurs sorties sont identiques et affiche le débit en échantillons par seconde
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+from scipy import signal
+
+import dsp
+
+SAMPLE_RATE = dsp.SAMPLE_RATE
+
+# --- Implémentations d'origine (boucles Python des scripts de génération) ---
+
+def legacy_one_pole_lowpass(noise, alpha):
+    """generate_sounds.generate_jet_sound"""
+    filtered = np.zeros_like(noise)
+    for i in range(1, len(noise)):
+        filtered[i] = alpha * noise[i] + (1 - alpha) * filtered[i-1]
+    return filtered
+
+def legacy_alternating_tones(t):
+    """generate_radio_sounds.generate_emergency_tone"""
+    sound = np.zeros_like(t)
+    for i in range(len(t)):
+        if (i // (SAMPLE_RATE // 4)) % 2 == 0:
+            sound[i] = np.sin(2 * np.pi * 800 * t[i])
+        else:
+            sound[i] = np.sin(2 * np.pi * 1000 * t[i])
+    return sound
+
+def legacy_beep_gate(t):
+    """generate_realistic_sounds.generate_alert_sound (altitude)"""
+    sound = np.zeros_like(t)
+    for i in range(int(len(t) / SAMPLE_RATE / 0.2)):
+        start = int(i * 0.2 * SAMPLE_RATE)
+        end = int((i * 0.2 + 0.1) * SAMPLE_RATE)
+        if end < len(sound):
+            sound[start:end] = np.sin(2 * np.pi * 1000 * t[start:end])
+    return sound
+
+def legacy_harmonics(t):
+    """generate_realistic_sounds.generate_helicopter_rotor"""
+    sound = np.zeros_like(t)
+    for i in range(1, 8):
+        sound += (1.0 / (i ** 0.7)) * np.sin(2 * np.pi * 6 * i * t)
+    return sound
+
+def legacy_bandpass(x):
+    """Conception du filtre à chaque appel, comme dans les scripts"""
+    sos = signal.butter(2, [300, 3000], 'bandpass', fs=SAMPLE_RATE, output='sos')
+    return signal.sosfilt(sos, x)
+
+def legacy_fade(x):
+    """Enveloppe complète allouée puis multipliée"""
+    envelope = np.ones_like(x)
+    fade_samples = int(0.01 * SAMPLE_RATE)
+    envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
+    envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
+    return x * envelope
+
+# --- Noyaux vectorisés ---
+
+def kernel_beep_gate(t):
+    sound = np.zeros_like(t)
+    for pulse in dsp.pulse_slices(len(t), 0.1, 0.2):
+        dsp.sine(1000, t[pulse], out=sound[pulse])
+    return sound
+
+def kernel_harmonics(t):
+    return dsp.harmonic_stack(2 * np.pi * 6 * t, [1.0 / (i ** 0.7) for i in range(1, 8)])
+
+def benchmark_cases(t, noise):
+    """Liste (nom, implémentation d'origine, noyau) à mesurer"""
+    return [
+        ("one_pole_lowpass",
+         lambda: legacy_one_pole_lowpass(noise, 0.1),
+         lambda: dsp.one_pole_lowpass(noise, 0.1)),
+        ("alternating_tones",
+         lambda: legacy_alternating_tones(t),
+         lambda: dsp.alternating_tones(t, [800, 1000], SAMPLE_RATE // 4)),
+        ("pulse_slices",
+         lambda: legacy_beep_gate(t),
+         lambda: kernel_beep_gate(t)),
+        ("harmonic_stack",
+         lambda: legacy_harmonics(t),
+         lambda: kernel_harmonics(t)),
+        ("bandpass",
+         lambda: legacy_bandpass(noise),
+         lambda: dsp.bandpass(noise, 300, 3000)),
+        ("fade",
+         lambda: legacy_fade(noise),
+         lambda: dsp.fade(noise.copy(), dsp.sample_count(0.01))),
+        ("normalize_int16",
+         lambda: (noise / np.max(np.abs(noise)) * 0.8 * 32767).astype(np.int16),
+         lambda: dsp.to_int16(noise, 0.8 / dsp.peak_level(noise))),
+    ]
+
+def same_output(legacy, kernel):
+    """
+    Indique si un noyau reproduit la sortie d'origine : à l'arrondi près pour les flottants,
+    à 1 LSB près pour le PCM 16 bits (ordre des multiplications différent)
+    """
+    legacy = np.asarray(legacy)
+    kernel = np.asarray(kernel)
+    if legacy.shape != kernel.shape or legacy.dtype != kernel.dtype:
+        return False
+    if np.issubdtype(legacy.dtype, np.integer):
+        return np.abs(legacy.astype(np.int64) - kernel).max(initial=0) <= 1
+    return np.allclose(legacy, kernel, rtol=1e-9, atol=1e-12)
+
+def best_time(func, repeat):
+    """Meilleur temps d'exécution sur plusieurs essais"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(duration, repeat):
+    """Mesure tous les noyaux et retourne les résultats"""
+    np.random.seed(0)
+    t = dsp.time_axis(duration)
+    noise = dsp.gaussian_noise(len(t))
+
+    results = []
+    for name, legacy, kernel in benchmark_cases(t, noise):
+        identical = bool(same_output(legacy(), kernel()))
+        legacy_time = best_time(legacy, repeat)
+        kernel_time = best_time(kernel, repeat)
+        results.append({
+            "kernel": name,
+            "samples": len(t),
+            "legacy_samples_per_s": len(t) / legacy_time,
+            "kernel_samples_per_s": len(t) / kernel_time,
+            "speedup": legacy_time / kernel_time,
+            "identical": identical,
+        })
+    return results
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Banc d'essai des noyaux DSP")
+    parser.add_argument("--duration", type=float, default=5,
+                        help="durée du signal de test en secondes (défaut : 5)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="nombre d'essais par mesure (défaut : 3)")
+    parser.add_argument("--json", help="écrit les résultats dans un fichier JSON")
+    args = parser.parse_args()
+
+    results = run(args.duration, args.repeat)
+
+    print("=" * 70)
+    print(f"  Noyaux DSP - {results[0]['samples']} échantillons")
+    print("=" * 70)
+    print(f"  {'Noyau':<20}{'Origine (éch/s)':>18}{'Vectorisé (éch/s)':>20}{'Gain':>10}")
+    for r in results:
+        print(f"  {r['kernel']:<20}{r['legacy_samples_per_s']:>18,.0f}"
+              f"{r['kernel_samples_per_s']:>20,.0f}{r['speedup']:>9.1f}x"
+              f"{'' if r['identical'] else '  ✗ sortie différente'}")
+    print("=" * 70)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    different = [r["kernel"] for r in results if not r["identical"]]
+    if different:
+        print(f"✗ Sortie différente de l'implémentation d'origine : {', '.join(different)}")
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Mesure des étapes de la construction (sons, base de données, catalogue)
+Temps réel, temps CPU, pics mémoire, échantillons générés et octets écrits par étape,
+rassemblés dans un rapport JSON et comparés à un rapport de référence
+
+Activation : variable d'environnement SVFR_PROFILE=<rapport.json> pour n'importe quel
+script de build/. Chaque script ajoute ses étapes au rapport (en remplaçant celles de
+son exécution précédente). SVFR_SEED=<entier> fixe la graine de tous les sons.
+
+  SVFR_PROFILE=profil.json python3 build_sounds.py --force
+  python3 build_profile.py show profil.json
+  python3 build_profile.py compare profil.json reference.json
+"""
+
+import argparse
+import atexit
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+PROFILE_ENV = "SVFR_PROFILE"
+SEED_ENV = "SVFR_SEED"
+
+# Métriques comparées : écart absolu minimal pour signaler une régression (bruit de mesure)
+METRIC_FLOORS = {
+    "wall_s": 0.05,
+    "cpu_s": 0.05,
+    "peak_rss_kb": 4096,
+    "tracemalloc_peak_kb": 1024,
+    "bytes_written": 4096,
+}
+
+# Hausse relative au-delà de laquelle une métrique est une régression
+DEFAULT_THRESHOLD = 0.25
+
+_stages = []
+_open_peaks = []  # [mémoire à l'entrée, pic] des mesures en cours
+_open_rss = []  # pic de mémoire résidente des mesures en cours, avant la dernière remise à zéro
+
+def report_path():
+    """Chemin du rapport demandé, ou None si la mesure n'est pas activée"""
+    return os.environ.get(PROFILE_ENV) or None
+
+def base_seed():
+    """Graine globale des sons (SVFR_SEED), ou None"""
+    value = os.environ.get(SEED_ENV)
+    return int(value) if value else None
+
+def _peak_rss_kb():
+    """Pic de mémoire résidente du processus depuis la dernière remise à zéro (Linux, Ko), ou None"""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+def _reset_peak_rss():
+    """
+    Remet à zéro le pic de mémoire résidente du processus (Linux >= 4.0)
+    Retourne False si c'est impossible : ru_maxrss ne donne que le pic depuis le démarrage,
+    inutilisable pour un processus de rendu qui enchaîne plusieurs sons
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def _bytes_written():
+    """Octets écrits par le processus depuis son démarrage (Linux), ou None"""
+    try:
+        with open("/proc/self/io", "r") as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+@contextmanager
+def measure():
+    """
+    Mesure le bloc et remplit le dictionnaire fourni à la sortie
+    Le bloc peut y ajouter ses compteurs (samples, rows, bytes_written...) et, sous la clé
+    "workers", les mesures du travail qu'il a confié à d'autres processus : leur temps CPU
+    et leurs octets écrits s'ajoutent alors aux siens.
+    Le pic tracemalloc est compté au-delà de la mémoire déjà allouée à l'entrée du bloc,
+    le pic de mémoire résidente depuis l'entrée du bloc (absent si le système ne permet pas
+    de le remettre à zéro), et les mesures imbriquées gardent des pics corrects pour le bloc englobant
+    """
+    metrics = {}
+    tracing = report_path() is not None
+    rss = _peak_rss_kb()
+    if rss is not None and _open_rss:
+        _open_rss[-1] = max(_open_rss[-1], rss)
+    rss_reset = rss is not None and _reset_peak_rss()
+    _open_rss.append(0)
+    if tracing:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        current, peak = tracemalloc.get_traced_memory()
+        if _open_peaks:
+            _open_peaks[-1][1] = max(_open_peaks[-1][1], peak)
+        tracemalloc.reset_peak()
+        _open_peaks.append([current, current])
+
+    written = _bytes_written()
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        yield metrics
+    finally:
+        workers = metrics.pop("workers", [])
+        metrics["wall_s"] = time.perf_counter() - wall
+        metrics["cpu_s"] = time.process_time() - cpu + sum(w["cpu_s"] for w in workers)
+        rss = max(_open_rss.pop(), _peak_rss_kb() or 0)
+        metrics["peak_rss_kb"] = rss if rss_reset else None
+        if _open_rss:
+            _open_rss[-1] = max(_open_rss[-1], rss)
+        if written is not None and "bytes_written" not in metrics:
+            metrics["bytes_written"] = _bytes_written() - written
+        if workers and metrics.get("bytes_written") is not None:
+            metrics["bytes_written"] += sum(w.get("bytes_written") or 0 for w in workers)
+        if tracing:
+            start, peak = _open_peaks.pop()
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            metrics["tracemalloc_peak_kb"] = (peak - start) // 1024
+            if _open_peaks:
+                _open_peaks[-1][1] = max(_open_peaks[-1][1], peak)
+
+def record(name, kind, metrics):
+    """Ajoute une étape mesurée au rapport du script en cours"""
+    names = {stage["name"] for stage in _stages}
+    unique = name
+    count = 1
+    while unique in names:
+        count += 1
+        unique = f"{name} ({count})"
+    _stages.append({"name": unique, "kind": kind, **metrics})
+
+@contextmanager
+def stage(name, kind):
+    """Mesure un bloc et l'enregistre comme étape du rapport"""
+    with measure() as metrics:
+        yield metrics
+    record(name, kind, metrics)
+
+def script_name():
+    """Nom du script en cours d'exécution"""
+    return os.path.splitext(os.path.basename(sys.argv[0] or "python"))[0]
+
+def load_report(path):
+    """Charge un rapport (vide s'il n'existe pas)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"stages": []}
+
+def write_report(path=None):
+    """
+    Ajoute les étapes du script en cours au rapport (écriture atomique)
+    Les étapes d'une exécution précédente du même script sont remplacées
+    """
+    path = path or report_path()
+    if path is None or not _stages:
+        return
+    script = script_name()
+    report = load_report(path)
+    report["stages"] = [s for s in report["stages"] if s["script"] != script]
+    report["stages"] += [{"script": script, **s} for s in _stages]
+    report["environment"] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "seed": base_seed(),
+    }
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1)
+    os.replace(tmp_path, path)
+
+def _write_at_exit():
+    # Les processus de rendu renvoient leurs mesures au processus principal
+    if multiprocessing.parent_process() is None:
+        write_report()
+
+atexit.register(_write_at_exit)
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare un rapport à une référence, étape par étape (script, nom)
+    Retourne (régressions, étapes dont le nombre d'échantillons ou de lignes a changé)
+    """
+    reference = {(s["script"], s["name"]): s for s in baseline["stages"]}
+    regressions = []
+    changes = []
+    for current in report["stages"]:
+        previous = reference.get((current["script"], current["name"]))
+        if previous is None:
+            continue
+        for metric, floor in METRIC_FLOORS.items():
+            new = current.get(metric)
+            old = previous.get(metric)
+            if new is None or old is None:
+                continue
+            if new > old * (1 + threshold) and new - old > floor:
+                regressions.append((current["script"], current["name"], metric, old, new))
+        for counter in ("samples", "rows"):
+            if current.get(counter) != previous.get(counter):
+                changes.append((current["script"], current["name"], counter,
+                                previous.get(counter), current.get(counter)))
+    return regressions, changes
+
+def show(report):
+    """Affiche un rapport sous forme de tableau"""
+    print(f"  {'Script':<24}{'Étape':<44}{'Réel (s)':>9}{'CPU (s)':>9}"
+          f"{'Pic (Ko)':>10}{'Éch./lignes':>12}{'Écrit (Ko)':>11}")
+    for s in report["stages"]:
+        count = s.get("samples", s.get("rows"))
+        print(f"  {s['script']:<24}{s['name'][:43]:<44}{s['wall_s']:>9.3f}{s['cpu_s']:>9.3f}"
+              f"{s.get('tracemalloc_peak_kb') or 0:>10}{count if count is not None else '':>12}"
+              f"{(s.get('bytes_written') or 0) // 1024:>11}")
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Rapports de mesure de la construction")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    show_parser = commands.add_parser("show", help="affiche un rapport")
+    show_parser.add_argument("report")
+
+    compare_parser = commands.add_parser("compare", help="compare un rapport à une référence")
+    compare_parser.add_argument("report")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help=f"hausse relative tolérée (défaut : {DEFAULT_THRESHOLD})")
+    args = parser.parse_args()
+
+    if args.command == "show":
+        show(load_report(args.report))
+        return
+
+    regressions, changes = compare(load_report(args.report), load_report(args.baseline), args.threshold)
+    for script, name, counter, old, new in changes:
+        print(f"  ~ {script} / {name} : {counter} {old} -> {new}")
+    for script, name, metric, old, new in regressions:
+        print(f"  ✗ {script} / {name} : {metric} {old:.3f} -> {new:.3f} (+{(new / old - 1) * 100 if old else 100:.0f} %)")
+    if regressions:
+        print(f"\n✗ {len(regressions)} régression(s) par rapport à {args.baseline}")
+        raise SystemExit(1)
+    print(f"✓ Aucune régression par rapport à {args.baseline}")
+
+if __name__ == "__main__":
+    main()
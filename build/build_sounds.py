@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Construction parallèle et incrémentale des sons du simulateur
+Rend les fichiers décrits dans sound_manifest.py sur plusieurs processus
+et saute ceux dont le générateur, les paramètres et la graine n'ont pas changé
+"""
+
+import argparse
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import build_profile
+from sound_manifest import SOUNDS, VARIANTS
+
+BUILD_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.normpath(os.path.join(BUILD_DIR, "..", "assets"))
+
+# Clés des sons du manifeste (chemin relatif -> clé, empreinte du contenu), suivies par git
+# avec les WAV : une copie fraîche du dépôt est déjà à jour
+KEYS_FILE = os.path.join(ASSETS_DIR, "sounds.keys.json")
+
+# Clés des fichiers non suivis par git (banque, déclinaisons)
+CACHE_FILE = os.path.join(ASSETS_DIR, ".sound_cache.json")
+
+# Banque regroupant tous les sons (voir soundbank.py)
+BANK_FILE = os.path.join(ASSETS_DIR, "sounds.bank")
+BANK_CACHE_ENTRY = "sounds.bank"
+
+# Déclinaisons des sons (voir sound_variants.py) et leur index
+VARIANTS_DIR = "variants"
+VARIANT_INDEX = os.path.join(ASSETS_DIR, VARIANTS_DIR, "index.json")
+VARIANT_INDEX_FORMAT = 1
+
+# Modules dont dépend le rendu de tous les sons, en plus du module du générateur
+SHARED_MODULES = ["build_sounds", "dsp", "build_profile"]
+
+_source_hashes = {}
+
+def source_hash(module_name):
+    """Retourne l'empreinte du fichier source d'un module du dossier build/"""
+    if module_name not in _source_hashes:
+        with open(os.path.join(BUILD_DIR, f"{module_name}.py"), "rb") as f:
+            _source_hashes[module_name] = hashlib.sha256(f.read()).hexdigest()
+    return _source_hashes[module_name]
+
+def asset_seed(asset):
+    """
+    Retourne la graine d'un son : explicite, sinon dérivée de son chemin
+    et de la graine globale SVFR_SEED si elle est fixée
+    """
+    if "seed" in asset:
+        return asset["seed"]
+    return zlib.crc32(asset["output"].encode("utf-8"), build_profile.base_seed() or 0)
+
+def asset_key(asset):
+    """
+    Calcule la clé d'un son : code du générateur, paramètres et graine
+    """
+    module_name = asset["generator"].split(":")[0]
+    description = {
+        "code": [source_hash(name) for name in [module_name] + SHARED_MODULES],
+        "generator": asset["generator"],
+        "params": asset["params"],
+        "seed": asset_seed(asset),
+        "stream": asset.get("stream", False),
+    }
+    encoded = json.dumps(description, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+def is_loop(asset):
+    """Indique si un son est joué en boucle"""
+    return bool(asset["params"].get("loop"))
+
+def active_variants():
+    """Déclinaisons du manifeste à produire (flac seulement si soundfile est installé)"""
+    flac = importlib.util.find_spec("soundfile") is not None
+    return [v for v in VARIANTS if v["format"] != "flac" or flac]
+
+def variant_output(asset, variant):
+    """Chemin relatif d'une déclinaison d'un son"""
+    root = os.path.splitext(asset["output"])[0]
+    extension = ".flac" if variant["format"] == "flac" else ".wav"
+    return f"{VARIANTS_DIR}/{variant['name']}/{root}{extension}"
+
+def variant_key(key, variant):
+    """Calcule la clé d'une déclinaison : clé du son, déclinaison et code de sound_variants"""
+    encoded = json.dumps([key, variant, source_hash("sound_variants")], sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+def read_json(path):
+    """Charge un fichier JSON (dictionnaire vide s'il est absent ou illisible)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_json(path, data):
+    """Écrit un fichier JSON s'il a changé (écriture atomique)"""
+    text = json.dumps(data, indent=1, sort_keys=True) + "\n"
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def load_cache():
+    """Charge les clés des sons du manifeste et des fichiers non suivis"""
+    return {**read_json(CACHE_FILE), **read_json(KEYS_FILE)}
+
+def save_cache(cache):
+    """Sauvegarde les clés : sons du manifeste dans KEYS_FILE, le reste dans CACHE_FILE"""
+    tracked = {a["output"] for a in SOUNDS}
+    write_json(KEYS_FILE, {k: v for k, v in cache.items() if k in tracked})
+    write_json(CACHE_FILE, {k: v for k, v in cache.items() if k not in tracked})
+
+def file_state(path):
+    """
+    Retourne l'empreinte du contenu d'un fichier, ou None
+    Contrairement à la taille et à la date, elle survit à une copie du dépôt
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+def is_up_to_date(asset, key, cache):
+    """Indique si le fichier sur disque correspond déjà à la clé du son"""
+    entry = cache.get(asset["output"])
+    if entry is None or entry["key"] != key:
+        return False
+    return file_state(os.path.join(ASSETS_DIR, asset["output"])) == entry["file"]
+
+def counted_blocks(blocks, metrics):
+    """Transmet les blocs d'un rendu en flux en comptant leurs échantillons"""
+    metrics["samples"] = 0
+    for block in blocks:
+        metrics["samples"] += len(block)
+        yield block
+
+def render_asset(asset, variants=(), write_output=True):
+    """
+    Rend un son du manifeste, l'écrit sur disque et le décline au passage
+    (exécuté dans un processus)
+    variants : liste de (chemin relatif, déclinaison)
+    write_output : False si le WAV est déjà à jour et que seules les déclinaisons manquent
+    Retourne (chemin relatif, mesures du rendu, nombre de trames de chaque déclinaison)
+    """
+    # Import tardif : scipy.signal est lent à charger et inutile si tout est à jour
+    import dsp
+    import sound_variants
+
+    module_name, function_name = asset["generator"].split(":")
+    generator = getattr(importlib.import_module(module_name), function_name)
+
+    path = os.path.join(ASSETS_DIR, asset["output"])
+    targets = [(os.path.join(ASSETS_DIR, output), variant) for output, variant in variants]
+    with build_profile.measure() as metrics:
+        np.random.seed(asset_seed(asset))
+        # Déclinaisons écrites au passage, à partir des échantillons flottants du rendu
+        fan_out = sound_variants.FanOut(targets, loop=is_loop(asset))
+        if asset.get("stream"):
+            # Rendu par blocs écrit directement dans le WAV (mémoire bornée par bloc)
+            blocks = fan_out.tee(counted_blocks(generator(seed=asset_seed(asset), **asset["params"]), metrics))
+            if write_output:
+                dsp.write_wav_stream(path, blocks)
+            else:
+                for _ in blocks:
+                    pass
+        else:
+            sound = generator(**asset["params"])
+            metrics["samples"] = len(sound)
+            if write_output:
+                dsp.write_wav(path, sound)
+            fan_out.write(sound)
+        frames = fan_out.close()
+        written = ([path] if write_output else []) + [t[0] for t in targets]
+        metrics["bytes_written"] = sum(os.path.getsize(p) for p in written)
+    return asset["output"], metrics, frames
+
+def select_assets(modules=None):
+    """Filtre le manifeste sur une liste de modules générateurs"""
+    if not modules:
+        return list(SOUNDS)
+    return [a for a in SOUNDS if a["generator"].split(":")[0] in modules]
+
+def build(modules=None, jobs=None, force=False, variants=True):
+    """
+    Rend tous les sons obsolètes du manifeste, avec leurs déclinaisons
+    Un son est rendu à nouveau si lui-même ou l'une de ses déclinaisons est obsolète ;
+    son WAV n'est réécrit que s'il est lui-même obsolète
+    Retourne la liste des chemins rendus
+    """
+    assets = select_assets(modules)
+    cache = load_cache()
+
+    keys = {a["output"]: asset_key(a) for a in assets}
+    targets = active_variants() if variants else []
+    outputs = {a["output"]: [(variant_output(a, v), v) for v in targets] for a in assets}
+
+    fresh = {a["output"]: not force and is_up_to_date(a, keys[a["output"]], cache) for a in assets}
+
+    def is_stale(asset):
+        key = keys[asset["output"]]
+        if not fresh[asset["output"]]:
+            return True
+        return not all(is_up_to_date({"output": output}, variant_key(key, variant), cache)
+                       for output, variant in outputs[asset["output"]])
+
+    todo = [a for a in assets if force or is_stale(a)]
+
+    print(f"{len(assets) - len(todo)} son(s) à jour, {len(todo)} à générer")
+    skipped = [v["name"] for v in VARIANTS if v not in targets] if variants else []
+    if skipped:
+        print(f"Déclinaisons ignorées (paquet soundfile absent) : {', '.join(skipped)}")
+    rendered = []
+
+    def record(result):
+        output, metrics, frames = result
+        path = os.path.join(ASSETS_DIR, output)
+        cache[output] = {"key": keys[output], "file": file_state(path)}
+        for (variant_path, variant), count in zip(outputs[output], frames):
+            variant_file = os.path.join(ASSETS_DIR, variant_path)
+            cache[variant_path] = {"key": variant_key(keys[output], variant),
+                                   "file": file_state(variant_file),
+                                   "frames": count, "bytes": os.path.getsize(variant_file)}
+        rendered.append(output)
+        build_profile.record(output, "asset", metrics)
+        print(f"  ✓ {output}")
+
+    try:
+        with build_profile.stage("build", "total") as totals:
+            if jobs == 1 or len(todo) <= 1:
+                for asset in todo:
+                    record(render_asset(asset, outputs[asset["output"]], not fresh[asset["output"]]))
+            else:
+                # Le total compte aussi le temps CPU et les écritures des processus de rendu
+                totals["workers"] = []
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    futures = [pool.submit(render_asset, asset, outputs[asset["output"]], not fresh[asset["output"]])
+                               for asset in todo]
+                    for future in as_completed(futures):
+                        result = future.result()
+                        totals["workers"].append(result[1])
+                        record(result)
+            update_bank(cache, force)
+            if targets:
+                update_variant_index(cache, targets)
+    finally:
+        # Conserver les sons terminés même si un rendu a échoué
+        save_cache(cache)
+
+    return rendered
+
+def bank_sounds():
+    """Sons de la banque : liste de (chemin relatif, son joué en boucle)"""
+    return [(a["output"], is_loop(a)) for a in SOUNDS]
+
+def update_bank(cache, force=False):
+    """
+    Reconstruit la banque de sons si un son du manifeste a changé
+    La banque n'est écrite que lorsque tous les sons du manifeste sont à jour
+    """
+    import soundbank
+
+    keys = [asset_key(a) for a in SOUNDS]
+    if not all(is_up_to_date(a, key, cache) for a, key in zip(SOUNDS, keys)):
+        print("Banque de sons non reconstruite : certains sons ne sont pas à jour")
+        return
+
+    bank_asset = {"output": BANK_CACHE_ENTRY}
+    encoded = json.dumps([keys, source_hash("soundbank")]).encode("utf-8")
+    bank_key = hashlib.sha256(encoded).hexdigest()
+    if not force and is_up_to_date(bank_asset, bank_key, cache):
+        return
+
+    sounds = bank_sounds()
+    with build_profile.stage(BANK_CACHE_ENTRY, "asset") as metrics:
+        soundbank.write_bank(BANK_FILE, sounds, ASSETS_DIR)
+        metrics["bytes_written"] = os.path.getsize(BANK_FILE)
+    cache[BANK_CACHE_ENTRY] = {"key": bank_key, "file": file_state(BANK_FILE)}
+    print(f"  ✓ {BANK_CACHE_ENTRY} ({len(sounds)} sons)")
+
+def update_variant_index(cache, variants):
+    """
+    Écrit l'index des déclinaisons (assets/variants/index.json) s'il a changé :
+    pour chaque son, ses déclinaisons à jour avec leur chemin, nombre de trames et taille
+    """
+    import soundbank
+
+    sounds = {}
+    for asset in SOUNDS:
+        key = asset_key(asset)
+        entries = {}
+        for variant in variants:
+            output = variant_output(asset, variant)
+            if is_up_to_date({"output": output}, variant_key(key, variant), cache):
+                entries[variant["name"]] = {"path": output, "frames": cache[output]["frames"],
+                                            "bytes": cache[output]["bytes"]}
+        if entries:
+            sounds[soundbank.sound_name(asset["output"])] = {"loop": is_loop(asset), "variants": entries}
+    index = {"format": VARIANT_INDEX_FORMAT, "variants": variants, "sounds": sounds}
+
+    try:
+        with open(VARIANT_INDEX, "r", encoding="utf-8") as f:
+            if json.load(f) == index:
+                return
+    except (OSError, ValueError):
+        pass
+
+    tmp_path = VARIANT_INDEX + ".tmp"
+    os.makedirs(os.path.dirname(VARIANT_INDEX), exist_ok=True)
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, ensure_ascii=False)
+    os.replace(tmp_path, VARIANT_INDEX)
+    print(f"  ✓ {VARIANTS_DIR}/index.json ({len(sounds)} sons, {len(variants)} déclinaisons)")
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Génère les sons du simulateur à partir du manifeste")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="nombre de processus (par défaut : nombre de cœurs)")
+    parser.add_argument("--force", action="store_true",
+                        help="régénère tous les sons, même à jour")
+    parser.add_argument("--module", action="append", dest="modules",
+                        help="limite la génération à un script (ex. generate_radio_sounds)")
+    parser.add_argument("--no-variants", dest="variants", action="store_false",
+                        help="ne produit pas les déclinaisons (VARIANTS du manifeste)")
+    parser.add_argument("--seed", type=int,
+                        help="graine globale des sons (comme SVFR_SEED)")
+    parser.add_argument("--profile", metavar="RAPPORT",
+                        help="écrit les mesures de chaque son dans un rapport JSON (comme SVFR_PROFILE)")
+    args = parser.parse_args()
+
+    # Transmis par l'environnement aux processus de rendu
+    if args.seed is not None:
+        os.environ[build_profile.SEED_ENV] = str(args.seed)
+    if args.profile:
+        os.environ[build_profile.PROFILE_ENV] = args.profile
+
+    print("=" * 70)
+    print("  Génération des sons du simulateur")
+    print("=" * 70)
+    print()
+
+    build(modules=args.modules, jobs=args.jobs, force=args.force, variants=args.variants)
+
+    print()
+    print("=" * 70)
+    print(f"  ✓ Sons à jour dans : {ASSETS_DIR}")
+    print("=" * 70)
+
+if __name__ == "__main__":
+    main()
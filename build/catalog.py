@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Catalogue précompilé du contenu du simulateur
+Instantané dénormalisé et en colonnes des avions, aéroports et pistes, lu en une
+seule lecture de fichier au lieu d'une requête par aéroport
+
+Format (assets/data/catalog.json) :
+  format, version    : version du format et empreinte du contenu de la base
+  <table>.columns    : une liste de valeurs par colonne, lignes dans l'ordre de la table
+  <table>.ranges     : groupes contigus, [valeur, début, fin] (fin exclue)
+  <table>.indices    : groupes non contigus, [valeur, [indices des lignes]]
+
+Ordre des lignes (celui du simulateur) :
+  aircraft : Manufacturer, Name    groupes : Type (indices)
+  airports : Country, City, Name   groupes : Country (plages), Size (indices)
+  runways  : aéroport puis Designation, référencées par RunwayStart/RunwayCount des aéroports
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import time
+
+import build_profile
+import seed_database
+
+BUILD_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_FILE = os.path.normpath(os.path.join(BUILD_DIR, "..", "assets", "data", "catalog.json"))
+
+FORMAT = 1
+
+def read_columns(conn, columns, query):
+    """Lit une requête en colonnes : {colonne: [valeurs]}"""
+    values = {column: [] for column in columns}
+    lists = [values[column] for column in columns]
+    for row in conn.execute(query):
+        for target, value in zip(lists, row):
+            target.append(value)
+    return values
+
+def ranges(values):
+    """Groupes contigus d'une colonne triée : [[valeur, début, fin], ...]"""
+    groups = []
+    for i, value in enumerate(values):
+        if groups and groups[-1][0] == value:
+            groups[-1][2] = i + 1
+        else:
+            groups.append([value, i, i + 1])
+    return groups
+
+def indices(values):
+    """Groupes d'une colonne non triée, par valeur croissante : [[valeur, [indices]], ...]"""
+    groups = {}
+    for i, value in enumerate(values):
+        groups.setdefault(value, []).append(i)
+    return [[value, groups[value]] for value in sorted(groups)]
+
+def snapshot(conn, version):
+    """Construit le catalogue à partir de la base"""
+    aircraft = read_columns(conn, seed_database.AIRCRAFT_COLUMNS,
+                            f"SELECT {', '.join(seed_database.AIRCRAFT_COLUMNS)} "
+                            f"FROM Aircraft ORDER BY Manufacturer, Name")
+    airports = read_columns(conn, seed_database.AIRPORT_COLUMNS,
+                            f"SELECT {', '.join(seed_database.AIRPORT_COLUMNS)} "
+                            f"FROM Airport ORDER BY Country, City, Name")
+
+    # Pistes regroupées dans l'ordre des aéroports : une plage par aéroport
+    by_airport = {}
+    runway_query = (f"SELECT {', '.join(seed_database.RUNWAY_COLUMNS)} "
+                    f"FROM Runway ORDER BY AirportIcao, Designation")
+    for row in conn.execute(runway_query):
+        by_airport.setdefault(row[0], []).append(row)
+
+    runways = {column: [] for column in seed_database.RUNWAY_COLUMNS}
+    runway_lists = [runways[column] for column in seed_database.RUNWAY_COLUMNS]
+    starts, counts = [], []
+    for icao in airports["IcaoCode"]:
+        rows = by_airport.get(icao, [])
+        starts.append(len(runways["AirportIcao"]))
+        counts.append(len(rows))
+        for row in rows:
+            for target, value in zip(runway_lists, row):
+                target.append(value)
+    airports["RunwayStart"] = starts
+    airports["RunwayCount"] = counts
+
+    return {
+        "format": FORMAT,
+        "version": version,
+        "aircraft": {
+            "columns": aircraft,
+            "indices": {"Type": indices(aircraft["Type"])},
+        },
+        "airports": {
+            "columns": airports,
+            "ranges": {"Country": ranges(airports["Country"])},
+            "indices": {"Size": indices(airports["Size"])},
+        },
+        "runways": {"columns": runways},
+    }
+
+def database_version(conn):
+    """Empreinte du contenu de la base (enregistrée par le remplissage, sinon calculée)"""
+    return seed_database.stored_content_hash(conn) or seed_database.content_hash(conn)
+
+def read_catalog(path=CATALOG_FILE):
+    """Catalogue brut (dictionnaire), ou None s'il n'existe pas"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def build_catalog(db_path=seed_database.DB_PATH, path=CATALOG_FILE, force=False):
+    """
+    Écrit le catalogue si le contenu de la base a changé depuis le dernier
+    Retourne le catalogue brut (écrit ou déjà à jour)
+    """
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        version = database_version(conn)
+        data = None if force else read_catalog(path)
+        if data is not None and data.get("format") == FORMAT and data.get("version") == version:
+            return data
+        with build_profile.stage("catalog", "db") as metrics:
+            data = snapshot(conn, version)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+            metrics["rows"] = sum(len(next(iter(data[t]["columns"].values())))
+                                  for t in ("aircraft", "airports", "runways"))
+            metrics["bytes_written"] = os.path.getsize(path)
+    finally:
+        conn.close()
+    return data
+
+class Catalog:
+    """Accès aux lignes et aux groupes du catalogue"""
+
+    def __init__(self, data):
+        self.version = data["version"]
+        self._tables = {name: data[name] for name in ("aircraft", "airports", "runways")}
+
+    def count(self, table):
+        """Nombre de lignes d'une table"""
+        columns = self._tables[table]["columns"]
+        return len(next(iter(columns.values())))
+
+    def column(self, table, column):
+        """Toutes les valeurs d'une colonne, dans l'ordre de la table"""
+        return self._tables[table]["columns"][column]
+
+    def row(self, table, i):
+        """Ligne i d'une table (dictionnaire)"""
+        return {column: values[i] for column, values in self._tables[table]["columns"].items()}
+
+    def rows(self, table, selection=None):
+        """Lignes d'une table (toutes ou une suite d'indices), dans l'ordre donné"""
+        if selection is None:
+            selection = range(self.count(table))
+        for i in selection:
+            yield self.row(table, i)
+
+    def groups(self, table, column):
+        """Groupes d'une table : {valeur: indices des lignes}, dans l'ordre des valeurs"""
+        table = self._tables[table]
+        if column in table.get("ranges", {}):
+            return {value: range(start, stop) for value, start, stop in table["ranges"][column]}
+        return {value: rows for value, rows in table["indices"][column]}
+
+    def runways(self, airport):
+        """Pistes d'un aéroport (indice dans airports)"""
+        start = self.column("airports", "RunwayStart")[airport]
+        count = self.column("airports", "RunwayCount")[airport]
+        return list(self.rows("runways", range(start, start + count)))
+
+def load_catalog(db_path=seed_database.DB_PATH, path=CATALOG_FILE):
+    """Charge le catalogue, reconstruit au préalable s'il ne correspond plus à la base"""
+    with build_profile.stage("load_catalog", "db"):
+        return Catalog(build_catalog(db_path, path))
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Construit le catalogue précompilé")
+    parser.add_argument("--db", default=seed_database.DB_PATH, help="chemin de la base SQLite")
+    parser.add_argument("--output", default=CATALOG_FILE, help="fichier du catalogue")
+    parser.add_argument("--force", action="store_true", help="reconstruit même si la base n'a pas changé")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    catalog = Catalog(build_catalog(args.db, args.output, args.force))
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ Catalogue {catalog.version[:12]} : {catalog.count('aircraft')} avions, "
+          f"{catalog.count('airports')} aéroports, {catalog.count('runways')} pistes "
+          f"({elapsed:.2f} s) : {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Noyaux DSP vectorisés partagés par les scripts de génération de sons
+Oscillateurs, harmoniques, filtrage IIR/SOS, enveloppes, portes et normalisation
+Inclut un rendu par blocs à mémoire constante pour les sons longs et les boucles
+"""
+
+import os
+import wave
+from functools import lru_cache
+
+import numpy as np
+from scipy import signal
+from scipy.io import wavfile
+
+# Fréquence d'échantillonnage
+SAMPLE_RATE = 44100
+
+# Taille des blocs du rendu en flux (échantillons)
+BLOCK_SIZE = 16384
+
+# Taille des blocs de bruit en flux : fixe pour que le rendu ne dépende pas de BLOCK_SIZE
+NOISE_BLOCK = 4096
+
+# Durée d'amorçage des filtres avant le début d'une boucle (secondes)
+LOOP_WARMUP = 1.0
+
+# --- Axes temporels et oscillateurs ---
+
+def sample_count(duration, rate=SAMPLE_RATE):
+    """Nombre d'échantillons pour une durée en secondes"""
+    return int(rate * duration)
+
+def time_axis(duration, rate=SAMPLE_RATE):
+    """Axe temporel de la durée demandée (bornes incluses, comme np.linspace)"""
+    return np.linspace(0, duration, sample_count(duration, rate))
+
+def sine(frequency, t, amplitude=1.0, out=None):
+    """Onde sinusoïdale (fréquence scalaire ou tableau), écrite dans out s'il est fourni"""
+    wave = np.sin(2 * np.pi * frequency * t, out=out)
+    if amplitude != 1.0:
+        wave *= amplitude
+    return wave
+
+def sweep(freq_start, freq_end, n, rate=SAMPLE_RATE):
+    """Balayage linéaire de fréquence à phase continue"""
+    freq = np.linspace(freq_start, freq_end, n)
+    return np.sin(2 * np.pi * np.cumsum(freq) / rate)
+
+def harmonic_stack(phase, amplitudes, multipliers=None):
+    """
+    Somme d'harmoniques sin(k * phase) pondérées
+    Par défaut les multiplicateurs sont 1, 2, 3...
+    """
+    if multipliers is None:
+        multipliers = range(1, len(amplitudes) + 1)
+    sound = np.zeros_like(phase)
+    for k, amp in zip(multipliers, amplitudes):
+        sound += amp * np.sin(k * phase)
+    return sound
+
+def alternating_tones(t, frequencies, segment_samples):
+    """Alterne entre plusieurs tons tous les segment_samples échantillons"""
+    selector = (np.arange(len(t)) // segment_samples) % len(frequencies)
+    sound = np.empty_like(t)
+    for i, freq in enumerate(frequencies):
+        mask = selector == i
+        sound[mask] = np.sin(2 * np.pi * freq * t[mask])
+    return sound
+
+# --- Bruit ---
+
+def uniform_noise(n, amplitude=1.0):
+    """Bruit blanc uniforme dans [-amplitude, amplitude]"""
+    return amplitude * np.random.uniform(-1, 1, n)
+
+def gaussian_noise(n, sigma=1.0):
+    """Bruit blanc gaussien"""
+    return np.random.normal(0, sigma, n)
+
+# --- Filtrage ---
+
+@lru_cache(maxsize=None)
+def bandpass_sos(low, high, order=2, rate=SAMPLE_RATE):
+    """Coefficients SOS d'un passe-bande de Butterworth (mis en cache)"""
+    return signal.butter(order, [low, high], 'bandpass', fs=rate, output='sos')
+
+def bandpass(x, low, high, order=2, rate=SAMPLE_RATE):
+    """Filtre passe-bande de Butterworth"""
+    return signal.sosfilt(bandpass_sos(low, high, order, rate), x)
+
+def one_pole_lowpass(x, alpha):
+    """Passe-bas à un pôle : y[0] = 0, puis y[i] = alpha * x[i] + (1 - alpha) * y[i-1]"""
+    y = np.zeros(len(x))
+    y[1:] = signal.lfilter([alpha], [1, alpha - 1], x[1:])
+    return y
+
+# --- Enveloppes et portes ---
+
+def ramp(start, end, n):
+    """Enveloppe linéaire"""
+    return np.linspace(start, end, n)
+
+def exp_decay(t, rate):
+    """Enveloppe exponentielle décroissante exp(-rate * t)"""
+    return np.exp(-rate * t)
+
+def fade(x, fade_samples):
+    """Applique un fondu linéaire en entrée et en sortie (évite les clics)"""
+    x[:fade_samples] *= np.linspace(0, 1, fade_samples)
+    x[-fade_samples:] *= np.linspace(1, 0, fade_samples)
+    return x
+
+def pulse_train(n, on_samples, period_samples, count=None):
+    """
+    Porte d'un train d'impulsions
+    Retourne (masque actif, position dans la période) pour chaque échantillon
+    """
+    index = np.arange(n)
+    position = index % period_samples
+    mask = position < on_samples
+    if count is not None:
+        mask &= index < count * period_samples
+    return mask, position
+
+def pulse_slices(n, on_duration, period, rate=SAMPLE_RATE):
+    """
+    Impulsions complètes d'un train d'impulsions (durées en secondes), sous forme de tranches
+    Préférable au masque de pulse_train pour un signal qui n'existe que pendant les impulsions :
+    il n'est calculé que sur les tranches actives. Les bornes sont tronquées comme dans les
+    boucles d'origine des générateurs, au même échantillon près
+    """
+    slices = []
+    for i in range(int(n / rate / period)):
+        start = int(i * period * rate)
+        end = int((i * period + on_duration) * rate)
+        if end < n:
+            slices.append(slice(start, end))
+    return slices
+
+# --- Normalisation et écriture ---
+
+def peak_level(x):
+    """Crête absolue d'un signal, sans tableau intermédiaire"""
+    return max(x.max(), -x.min())
+
+def normalize(x, peak):
+    """Normalise le signal sur la crête demandée (en place)"""
+    x *= peak / peak_level(x)
+    return x
+
+def to_int16(x, gain=1.0):
+    """Convertit un signal [-1, 1] en PCM 16 bits, gain compris, en une seule passe"""
+    out = np.empty(np.shape(x), dtype=np.int16)
+    np.multiply(x, 32767 * gain, out=out, casting="unsafe")
+    return out
+
+def write_wav(path, x, rate=SAMPLE_RATE):
+    """Sauvegarde un signal en WAV int16 (écriture atomique)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    wavfile.write(tmp_path, rate, to_int16(x))
+    os.replace(tmp_path, path)
+
+# --- Rendu en flux (mémoire bornée par la taille de bloc) ---
+#
+# Un son en flux est décrit par une fonction render(start, n, filters) qui produit les
+# échantillons [start, start + n) à partir de leur position absolue. Les oscillateurs
+# calculent leur phase depuis cette position et le bruit est tiré par blocs indexés :
+# tout bloc peut donc être rendu à nouveau à l'identique. Seul l'état des filtres
+# (zi de sosfilt) est transporté d'un bloc au suivant.
+#
+# Pour une boucle de N échantillons, les fréquences sont arrondies à un nombre entier
+# de cycles sur N et les positions sont prises modulo N : les oscillateurs et le bruit
+# sont alors exactement périodiques. Les filtres sont amorcés sur la fin de la boucle,
+# si bien que le dernier échantillon s'enchaîne sur le premier sans raccord.
+
+def loop_frequency(frequency, period, rate=SAMPLE_RATE):
+    """Arrondit une fréquence à un nombre entier de cycles sur period échantillons"""
+    if period is None:
+        return frequency
+    cycles = max(1, round(frequency * period / rate))
+    return cycles * rate / period
+
+def block_time(start, n, period=None, rate=SAMPLE_RATE):
+    """Temps des échantillons [start, start + n), pris modulo period si c'est une boucle"""
+    index = np.arange(start, start + n)
+    if period is not None:
+        index %= period
+    return index / rate
+
+def stream_noise(seed, start, n, sigma=1.0):
+    """
+    Bruit gaussien des échantillons [start, start + n)
+    Chaque bloc de NOISE_BLOCK échantillons a sa propre graine (accès aléatoire)
+    """
+    first = start // NOISE_BLOCK
+    last = (start + n - 1) // NOISE_BLOCK
+    blocks = [np.random.default_rng([seed, b]).standard_normal(NOISE_BLOCK)
+              for b in range(first, last + 1)]
+    offset = start - first * NOISE_BLOCK
+    return sigma * np.concatenate(blocks)[offset:offset + n]
+
+def stream_seed(seed=None):
+    """Graine du bruit en flux, tirée du générateur global si elle n'est pas fournie"""
+    if seed is None:
+        return int(np.random.randint(2**31))
+    return seed
+
+class SosStream:
+    """Filtre SOS dont l'état est conservé d'un bloc à l'autre"""
+
+    def __init__(self, sos):
+        self.sos = sos
+        self.zi = np.zeros((sos.shape[0], 2))
+
+    def __call__(self, x):
+        y, self.zi = signal.sosfilt(self.sos, x, zi=self.zi)
+        return y
+
+def _render_pass(render, start, stop, filters, block_size):
+    """Rend les blocs [start, stop) en transportant l'état des filtres"""
+    for block_start in range(start, stop, block_size):
+        yield render(block_start, min(block_size, stop - block_start), filters)
+
+def stream_render(render, total, filter_sos, peak, loop=False, block_size=BLOCK_SIZE):
+    """
+    Générateur de blocs normalisés sur la crête demandée
+    Première passe pour mesurer la crête, seconde passe pour produire les blocs :
+    aucun tampon de la durée totale n'est alloué
+    """
+    filters = [SosStream(sos) for sos in filter_sos]
+
+    # Amorçage des filtres sur la fin de la boucle
+    if loop:
+        warmup = min(total, sample_count(LOOP_WARMUP))
+        for _ in _render_pass(render, total - warmup, total, filters, block_size):
+            pass
+    initial_state = [f.zi.copy() for f in filters]
+
+    max_level = 0.0
+    for block in _render_pass(render, 0, total, filters, block_size):
+        max_level = max(max_level, peak_level(block))
+
+    for f, zi in zip(filters, initial_state):
+        f.zi = zi.copy()
+    gain = peak / max_level
+    for block in _render_pass(render, 0, total, filters, block_size):
+        yield block * gain
+
+def write_wav_stream(path, blocks, rate=SAMPLE_RATE):
+    """Sauvegarde des blocs successifs en WAV int16 mono (écriture atomique)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with wave.open(tmp_path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        for block in blocks:
+            wav.writeframes(to_int16(block).astype("<i2", copy=False).tobytes())
+    os.replace(tmp_path, path)
@@ -4,279 +4,159 @@ Script pour générer les sons radio supplémentaires
 """
 
 import numpy as np
-from scipy.io import wavfile
-from scipy import signal
-import os
 
-SAMPLE_RATE = 44100
+import dsp
 
-def create_directory():
-    """Crée le répertoire des sons radio"""
-    sounds_dir = "../assets/sounds/radio"
-    os.makedirs(sounds_dir, exist_ok=True)
-    return sounds_dir
+SAMPLE_RATE = dsp.SAMPLE_RATE
 
-def generate_radio_beep(filename):
+def generate_radio_beep():
     """
     Génère un bip radio court
     """
-    duration = 0.3
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = dsp.time_axis(0.3)
     
     # Bip à 1000 Hz
-    freq = 1000
-    sound = np.sin(2 * np.pi * freq * t)
+    sound = dsp.sine(1000, t)
     
     # Envelope pour éviter les clics
-    envelope = np.ones_like(sound)
-    fade_samples = int(0.01 * SAMPLE_RATE)
-    envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
-    envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
-    sound *= envelope
+    sound = dsp.fade(sound, dsp.sample_count(0.01))
     
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.7
-    
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return dsp.normalize(sound, 0.7)
 
-def generate_radio_tune(filename):
+def generate_radio_tune():
     """
     Génère un son de syntonisation radio
     """
-    duration = 0.5
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    n = dsp.sample_count(0.5)
     
     # Balayage de fréquence
-    freq_start = 800
-    freq_end = 1200
-    freq = np.linspace(freq_start, freq_end, len(t))
-    
-    # Générer le son
-    phase = 2 * np.pi * np.cumsum(freq) / SAMPLE_RATE
-    sound = np.sin(phase)
+    sound = dsp.sweep(800, 1200, n)
     
     # Ajouter du bruit
-    noise = np.random.normal(0, 0.1, len(t))
-    sound = sound * 0.7 + noise * 0.3
+    sound = sound * 0.7 + dsp.gaussian_noise(n, 0.1) * 0.3
     
     # Envelope
-    envelope = np.linspace(0.3, 1, len(t))
-    sound *= envelope
+    sound *= dsp.ramp(0.3, 1, n)
     
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.6
-    
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return dsp.normalize(sound, 0.6)
 
-def generate_radio_click(filename):
+def generate_radio_click():
     """
     Génère un clic de bouton radio
     """
-    duration = 0.1
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = dsp.time_axis(0.1)
     
     # Clic court
     sound = np.zeros_like(t)
-    click_duration = int(0.01 * SAMPLE_RATE)
-    sound[:click_duration] = np.random.normal(0, 1, click_duration)
+    click_samples = dsp.sample_count(0.01)
+    sound[:click_samples] = dsp.gaussian_noise(click_samples)
     
     # Filtrer
-    sos = signal.butter(2, [200, 2000], 'bandpass', fs=SAMPLE_RATE, output='sos')
-    sound = signal.sosfilt(sos, sound)
+    sound = dsp.bandpass(sound, 200, 2000)
     
     # Envelope
-    envelope = np.exp(-t * 20)
-    sound *= envelope
-    
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.5
+    sound *= dsp.exp_decay(t, 20)
     
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return dsp.normalize(sound, 0.5)
 
-def generate_radio_squelch(filename):
+def generate_radio_squelch():
     """
     Génère un son de squelch radio (ouverture de fréquence)
     """
-    duration = 0.2
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = dsp.time_axis(0.2)
     
-    # Bruit blanc court
-    noise = np.random.normal(0, 1, len(t))
-    
-    # Filtrer pour simuler le squelch
-    sos = signal.butter(2, [300, 3000], 'bandpass', fs=SAMPLE_RATE, output='sos')
-    sound = signal.sosfilt(sos, noise)
+    # Bruit blanc court filtré pour simuler le squelch
+    sound = dsp.bandpass(dsp.gaussian_noise(len(t)), 300, 3000)
     
     # Envelope rapide
-    envelope = np.exp(-t * 15)
-    sound *= envelope * 0.3
-    
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.4
+    sound *= dsp.exp_decay(t, 15) * 0.3
     
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return dsp.normalize(sound, 0.4)
 
-def generate_atc_background(filename):
+def generate_atc_background():
     """
     Génère un fond sonore de tour de contrôle
     """
-    duration = 10
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
-    
-    # Bruit de fond très léger
-    noise = np.random.normal(0, 0.05, len(t))
+    t = dsp.time_axis(10)
     
-    # Filtrer pour simuler l'ambiance
-    sos = signal.butter(2, [100, 1000], 'bandpass', fs=SAMPLE_RATE, output='sos')
-    sound = signal.sosfilt(sos, noise)
+    # Bruit de fond très léger, filtré pour simuler l'ambiance
+    sound = dsp.bandpass(dsp.gaussian_noise(len(t), 0.05), 100, 1000)
     
     # Ajouter des variations
-    modulation = 1 + 0.1 * np.sin(2 * np.pi * 0.3 * t)
-    sound *= modulation
+    sound *= 1 + dsp.sine(0.3, t, 0.1)
     
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.15
-    
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return dsp.normalize(sound, 0.15)
 
-def generate_radio_interference(filename):
+def generate_radio_interference():
     """
     Génère des interférences radio
     """
-    duration = 2
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
-    
-    # Bruit avec modulation
-    noise = np.random.normal(0, 1, len(t))
+    t = dsp.time_axis(2)
     
-    # Modulation rapide pour simuler les interférences
-    interference_freq = 50
-    modulation = 0.5 + 0.5 * np.sin(2 * np.pi * interference_freq * t)
-    sound = noise * modulation
+    # Bruit avec modulation rapide pour simuler les interférences
+    sound = dsp.gaussian_noise(len(t)) * (0.5 + dsp.sine(50, t, 0.5))
     
     # Filtrer
-    sos = signal.butter(2, [500, 2500], 'bandpass', fs=SAMPLE_RATE, output='sos')
-    sound = signal.sosfilt(sos, sound)
-    
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.3
+    sound = dsp.bandpass(sound, 500, 2500)
     
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return dsp.normalize(sound, 0.3)
 
-def generate_emergency_tone(filename):
+def generate_emergency_tone():
     """
     Génère un ton d'urgence
     """
-    duration = 1
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
-    
-    # Deux tons alternés (comme les sirènes)
-    freq1 = 800
-    freq2 = 1000
-    
-    # Alterner toutes les 0.25 secondes
-    sound = np.zeros_like(t)
-    for i in range(len(t)):
-        if (i // (SAMPLE_RATE // 4)) % 2 == 0:
-            sound[i] = np.sin(2 * np.pi * freq1 * t[i])
-        else:
-            sound[i] = np.sin(2 * np.pi * freq2 * t[i])
+    t = dsp.time_axis(1)
     
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.8
+    # Deux tons alternés toutes les 0.25 secondes (comme les sirènes)
+    sound = dsp.alternating_tones(t, [800, 1000], SAMPLE_RATE // 4)
     
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return dsp.normalize(sound, 0.8)
 
-def generate_frequency_change(filename):
+def generate_frequency_change():
     """
     Génère un son de changement de fréquence
     """
-    duration = 0.3
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    n = dsp.sample_count(0.3)
     
     # Bip montant
-    freq_start = 600
-    freq_end = 1200
-    freq = np.linspace(freq_start, freq_end, len(t))
-    
-    phase = 2 * np.pi * np.cumsum(freq) / SAMPLE_RATE
-    sound = np.sin(phase)
+    sound = dsp.sweep(600, 1200, n)
     
     # Envelope
-    envelope = np.linspace(1, 0.3, len(t))
-    sound *= envelope
-    
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.5
+    sound *= dsp.ramp(1, 0.3, n)
     
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return dsp.normalize(sound, 0.5)
 
-def generate_roger_beep(filename):
+def generate_roger_beep():
     """
     Génère un bip de confirmation (Roger)
     """
-    duration = 0.15
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = dsp.time_axis(0.15)
     
     # Double bip rapide
-    freq = 1200
-    sound = np.sin(2 * np.pi * freq * t)
+    sound = dsp.sine(1200, t)
     
     # Créer deux bips
-    gap_start = int(0.06 * SAMPLE_RATE)
-    gap_end = int(0.09 * SAMPLE_RATE)
-    sound[gap_start:gap_end] = 0
+    sound[dsp.sample_count(0.06):dsp.sample_count(0.09)] = 0
     
     # Envelope
-    envelope = np.ones_like(sound)
-    fade = int(0.005 * SAMPLE_RATE)
-    envelope[:fade] = np.linspace(0, 1, fade)
-    envelope[-fade:] = np.linspace(1, 0, fade)
-    sound *= envelope
-    
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.6
+    sound = dsp.fade(sound, dsp.sample_count(0.005))
     
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return dsp.normalize(sound, 0.6)
 
 def main():
-    """Génère tous les sons radio"""
-    
+    """Génère tous les sons radio décrits dans sound_manifest.py"""
+    import build_sounds
+
     print("=" * 70)
     print("  Génération des sons radio")
     print("=" * 70)
     print()
-    
-    sounds_dir = create_directory()
-    
-    print("Génération des sons d'interface radio...")
-    generate_radio_beep(f"{sounds_dir}/radio_beep.wav")
-    generate_radio_tune(f"{sounds_dir}/radio_tune.wav")
-    generate_radio_click(f"{sounds_dir}/radio_click.wav")
-    generate_radio_squelch(f"{sounds_dir}/radio_squelch.wav")
-    generate_frequency_change(f"{sounds_dir}/frequency_change.wav")
-    generate_roger_beep(f"{sounds_dir}/roger_beep.wav")
-    
-    print("\nGénération des sons d'ambiance...")
-    generate_atc_background(f"{sounds_dir}/atc_background.wav")
-    generate_radio_interference(f"{sounds_dir}/radio_interference.wav")
-    
-    print("\nGénération des sons d'urgence...")
-    generate_emergency_tone(f"{sounds_dir}/emergency_tone.wav")
-    
+
+    build_sounds.build(modules=["generate_radio_sounds"])
+
     print()
     print("=" * 70)
     print("  ✓ Tous les sons radio ont été générés avec succès!")
-    print(f"  Répertoire: {sounds_dir}")
     print("=" * 70)
 
 if __name__ == "__main__":
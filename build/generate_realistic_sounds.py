@@ -5,309 +5,250 @@ Utilise des techniques de synthèse audio avancées
 """
 
 import numpy as np
-from scipy.io import wavfile
-from scipy import signal
-import os
+
+import dsp
 
 # Paramètres audio
-SAMPLE_RATE = 44100
+SAMPLE_RATE = dsp.SAMPLE_RATE
 DURATION = 5  # secondes
 
-def create_directory():
-    """Crée le répertoire des sons s'il n'existe pas"""
-    sounds_dir = "../assets/sounds/realistic"
-    os.makedirs(sounds_dir, exist_ok=True)
-    return sounds_dir
+# Bande passante et amplitude du bruit de réacteur selon la poussée
+JET_THRUST_SETTINGS = {
+    "idle": ((200, 2000), 0.3),
+    "cruise": ((300, 5000), 0.6),
+    "full_throttle": ((400, 8000), 0.9),
+}
+
+# Bande passante et amplitude du vent selon l'intensité
+WIND_SETTINGS = {
+    "light": ((100, 1000), 0.2),
+    "moderate": ((150, 2000), 0.4),
+    "strong": ((200, 3000), 0.6),
+}
 
-def generate_engine_sound(base_freq, harmonics, noise_level, filename):
+# Les sons de moteur et d'environnement sont rendus par blocs (stream_*) : la mémoire
+# reste bornée par la taille de bloc quelle que soit la durée, et loop=True produit
+# une boucle sans raccord. Les fonctions generate_* assemblent ces blocs en un tampon.
+
+def stream_engine_sound(base_freq, harmonics, noise_level, duration=DURATION, loop=False,
+                        seed=None, block_size=dsp.BLOCK_SIZE):
     """
-    Génère un son de moteur réaliste
+    Génère un son de moteur réaliste par blocs
     """
-    t = np.linspace(0, DURATION, int(SAMPLE_RATE * DURATION))
-    sound = np.zeros_like(t)
+    total = dsp.sample_count(duration)
+    period = total if loop else None
+    seed = dsp.stream_seed(seed)
     
-    # Ajouter les harmoniques
-    for i, (freq, amp) in enumerate(harmonics):
-        # Variation légère de fréquence pour le réalisme
-        freq_variation = np.sin(2 * np.pi * 0.5 * t) * freq * 0.02
-        phase = 2 * np.pi * (freq + freq_variation) * t
-        sound += amp * np.sin(phase)
-    
-    # Ajouter du bruit pour le réalisme
-    noise = np.random.normal(0, noise_level, len(t))
-    sound += noise
+    # Variation légère de fréquence (2 % à 0.5 Hz) pour le réalisme
+    mod_freq = dsp.loop_frequency(0.5, period)
+    freqs = [dsp.loop_frequency(freq, period) for freq, _ in harmonics]
+    amps = [amp for _, amp in harmonics]
     
     # Filtrer pour simuler la résonance
-    sos = signal.butter(4, [base_freq * 0.5, base_freq * 8], 'bandpass', fs=SAMPLE_RATE, output='sos')
-    sound = signal.sosfilt(sos, sound)
-    
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.8
-    
-    # Sauvegarder
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    sos = dsp.bandpass_sos(base_freq * 0.5, base_freq * 8, order=4)
+    
+    def render(start, n, filters):
+        t = dsp.block_time(start, n, period)
+        # Phase intégrée de la fréquence modulée f * (1 + 0.02 sin(2 pi fm t))
+        phase = 2 * np.pi * t - (0.02 / mod_freq) * np.cos(2 * np.pi * mod_freq * t)
+        sound = dsp.harmonic_stack(phase, amps, multipliers=freqs)
+        
+        # Ajouter du bruit pour le réalisme
+        sound += dsp.stream_noise(seed, start, n, noise_level)
+        return filters[0](sound)
+    
+    return dsp.stream_render(render, total, [sos], 0.8, loop, block_size)
 
-def generate_propeller_sound(rpm, num_blades, filename):
+def generate_engine_sound(base_freq, harmonics, noise_level, duration=DURATION, loop=False):
     """
-    Génère un son d'hélice
+    Génère un son de moteur réaliste
+    """
+    return np.concatenate(list(stream_engine_sound(base_freq, harmonics, noise_level, duration, loop)))
+
+def stream_propeller_sound(rpm, num_blades, duration=DURATION, loop=False,
+                           seed=None, block_size=dsp.BLOCK_SIZE):
+    """
+    Génère un son d'hélice par blocs
     """
-    t = np.linspace(0, DURATION, int(SAMPLE_RATE * DURATION))
+    total = dsp.sample_count(duration)
+    period = total if loop else None
+    seed = dsp.stream_seed(seed)
     
     # Fréquence de base (passage des pales)
-    blade_freq = (rpm / 60) * num_blades
-    
-    sound = np.zeros_like(t)
-    
-    # Harmoniques de l'hélice
-    for i in range(1, 6):
-        amp = 1.0 / i
-        sound += amp * np.sin(2 * np.pi * blade_freq * i * t)
+    blade_freq = dsp.loop_frequency((rpm / 60) * num_blades, period)
+    mod_freq = dsp.loop_frequency(3, period)
+    
+    def render(start, n, filters):
+        t = dsp.block_time(start, n, period)
+        
+        # Harmoniques de l'hélice
+        sound = dsp.harmonic_stack(2 * np.pi * blade_freq * t, [1.0 / i for i in range(1, 6)])
+        
+        # Modulation pour le réalisme
+        sound *= 1 + dsp.sine(mod_freq, t, 0.1)
+        
+        # Bruit aérodynamique
+        sound += filters[0](dsp.stream_noise(seed, start, n, 0.1))
+        return sound
+    
+    return dsp.stream_render(render, total, [dsp.bandpass_sos(200, 4000)], 0.8, loop, block_size)
+
+def generate_propeller_sound(rpm, num_blades, duration=DURATION, loop=False):
+    """
+    Génère un son d'hélice
+    """
+    return np.concatenate(list(stream_propeller_sound(rpm, num_blades, duration, loop)))
+
+def stream_jet_sound(thrust_level, duration=DURATION, loop=False,
+                     seed=None, block_size=dsp.BLOCK_SIZE):
+    """
+    Génère un son de réacteur par blocs
+    """
+    total = dsp.sample_count(duration)
+    period = total if loop else None
+    seed = dsp.stream_seed(seed)
     
-    # Modulation pour le réalisme
-    modulation = 1 + 0.1 * np.sin(2 * np.pi * 3 * t)
-    sound *= modulation
+    # Bruit blanc filtré selon le niveau de poussée pour simuler le jet
+    (low, high), base_amp = JET_THRUST_SETTINGS.get(thrust_level, JET_THRUST_SETTINGS["full_throttle"])
     
-    # Bruit aérodynamique
-    noise = np.random.normal(0, 0.1, len(t))
-    sos = signal.butter(2, [200, 4000], 'bandpass', fs=SAMPLE_RATE, output='sos')
-    noise = signal.sosfilt(sos, noise)
-    sound += noise
+    # Composante tonale (compresseur) et modulation
+    compressor_freq = dsp.loop_frequency(150 + thrust_level_to_number(thrust_level) * 100, period)
+    mod_freq = dsp.loop_frequency(5, period)
     
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.8
+    def render(start, n, filters):
+        t = dsp.block_time(start, n, period)
+        sound = filters[0](dsp.stream_noise(seed, start, n)) * base_amp
+        sound += dsp.sine(compressor_freq, t, 0.2)
+        sound *= 1 + dsp.sine(mod_freq, t, 0.05)
+        return sound
     
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return dsp.stream_render(render, total, [dsp.bandpass_sos(low, high, order=4)], 0.8, loop, block_size)
 
-def generate_jet_sound(thrust_level, filename):
+def generate_jet_sound(thrust_level, duration=DURATION, loop=False):
     """
     Génère un son de réacteur
     """
-    t = np.linspace(0, DURATION, int(SAMPLE_RATE * DURATION))
-    
-    # Bruit blanc filtré pour simuler le jet
-    noise = np.random.normal(0, 1, len(t))
-    
-    # Filtrage selon le niveau de poussée
-    if thrust_level == "idle":
-        sos = signal.butter(4, [200, 2000], 'bandpass', fs=SAMPLE_RATE, output='sos')
-        base_amp = 0.3
-    elif thrust_level == "cruise":
-        sos = signal.butter(4, [300, 5000], 'bandpass', fs=SAMPLE_RATE, output='sos')
-        base_amp = 0.6
-    else:  # full_throttle
-        sos = signal.butter(4, [400, 8000], 'bandpass', fs=SAMPLE_RATE, output='sos')
-        base_amp = 0.9
-    
-    sound = signal.sosfilt(sos, noise) * base_amp
-    
-    # Ajouter une composante tonale (compresseur)
-    compressor_freq = 150 + thrust_level_to_number(thrust_level) * 100
-    sound += 0.2 * np.sin(2 * np.pi * compressor_freq * t)
-    
-    # Modulation pour le réalisme
-    modulation = 1 + 0.05 * np.sin(2 * np.pi * 5 * t)
-    sound *= modulation
-    
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.8
-    
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return np.concatenate(list(stream_jet_sound(thrust_level, duration, loop)))
 
 def thrust_level_to_number(level):
     """Convertit le niveau de poussée en nombre"""
     levels = {"idle": 0, "cruise": 1, "full_throttle": 2}
     return levels.get(level, 1)
 
-def generate_helicopter_rotor(rpm, filename):
+def stream_helicopter_rotor(rpm, duration=DURATION, loop=False,
+                            seed=None, block_size=dsp.BLOCK_SIZE):
     """
-    Génère un son de rotor d'hélicoptère
+    Génère un son de rotor d'hélicoptère par blocs
     """
-    t = np.linspace(0, DURATION, int(SAMPLE_RATE * DURATION))
+    total = dsp.sample_count(duration)
+    period = total if loop else None
+    seed = dsp.stream_seed(seed)
     
     # Fréquence du rotor
-    rotor_freq = rpm / 60
-    
-    sound = np.zeros_like(t)
-    
-    # Son caractéristique "whop whop"
-    for i in range(1, 8):
-        amp = 1.0 / (i ** 0.7)
-        sound += amp * np.sin(2 * np.pi * rotor_freq * i * t)
-    
-    # Modulation d'amplitude pour le "whop whop"
-    modulation = 0.5 + 0.5 * np.sin(2 * np.pi * rotor_freq * t)
-    sound *= modulation
-    
-    # Bruit aérodynamique
-    noise = np.random.normal(0, 0.15, len(t))
-    sos = signal.butter(2, [100, 3000], 'bandpass', fs=SAMPLE_RATE, output='sos')
-    noise = signal.sosfilt(sos, noise)
-    sound += noise
-    
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.8
-    
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    rotor_freq = dsp.loop_frequency(rpm / 60, period)
+    
+    def render(start, n, filters):
+        t = dsp.block_time(start, n, period)
+        
+        # Son caractéristique "whop whop"
+        sound = dsp.harmonic_stack(2 * np.pi * rotor_freq * t, [1.0 / (i ** 0.7) for i in range(1, 8)])
+        
+        # Modulation d'amplitude pour le "whop whop"
+        sound *= 0.5 + dsp.sine(rotor_freq, t, 0.5)
+        
+        # Bruit aérodynamique
+        sound += filters[0](dsp.stream_noise(seed, start, n, 0.15))
+        return sound
+    
+    return dsp.stream_render(render, total, [dsp.bandpass_sos(100, 3000)], 0.8, loop, block_size)
 
-def generate_wind_sound(intensity, filename):
+def generate_helicopter_rotor(rpm, duration=DURATION, loop=False):
     """
-    Génère un son de vent
+    Génère un son de rotor d'hélicoptère
+    """
+    return np.concatenate(list(stream_helicopter_rotor(rpm, duration, loop)))
+
+def stream_wind_sound(intensity, duration=DURATION, loop=False,
+                      seed=None, block_size=dsp.BLOCK_SIZE):
     """
-    t = np.linspace(0, DURATION, int(SAMPLE_RATE * DURATION))
+    Génère un son de vent par blocs
+    """
+    total = dsp.sample_count(duration)
+    period = total if loop else None
+    seed = dsp.stream_seed(seed)
     
     # Bruit filtré pour le vent
-    noise = np.random.normal(0, 1, len(t))
-    
-    if intensity == "light":
-        sos = signal.butter(2, [100, 1000], 'bandpass', fs=SAMPLE_RATE, output='sos')
-        amp = 0.2
-    elif intensity == "moderate":
-        sos = signal.butter(2, [150, 2000], 'bandpass', fs=SAMPLE_RATE, output='sos')
-        amp = 0.4
-    else:  # strong
-        sos = signal.butter(2, [200, 3000], 'bandpass', fs=SAMPLE_RATE, output='sos')
-        amp = 0.6
-    
-    sound = signal.sosfilt(sos, noise) * amp
+    (low, high), amp = WIND_SETTINGS.get(intensity, WIND_SETTINGS["strong"])
     
     # Modulation lente pour le réalisme
-    modulation = 1 + 0.3 * np.sin(2 * np.pi * 0.3 * t)
-    sound *= modulation
+    mod_freq = dsp.loop_frequency(0.3, period)
     
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.8
+    def render(start, n, filters):
+        t = dsp.block_time(start, n, period)
+        sound = filters[0](dsp.stream_noise(seed, start, n)) * amp
+        sound *= 1 + dsp.sine(mod_freq, t, 0.3)
+        return sound
     
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return dsp.stream_render(render, total, [dsp.bandpass_sos(low, high)], 0.8, loop, block_size)
+
+def generate_wind_sound(intensity, duration=DURATION, loop=False):
+    """
+    Génère un son de vent
+    """
+    return np.concatenate(list(stream_wind_sound(intensity, duration, loop)))
 
-def generate_alert_sound(alert_type, filename):
+def generate_alert_sound(alert_type):
     """
     Génère un son d'alerte
     """
-    t = np.linspace(0, 2, int(SAMPLE_RATE * 2))  # Alertes plus courtes
+    t = dsp.time_axis(2)  # Alertes plus courtes
     
     if alert_type == "altitude":
-        # Bip-bip rapide
-        freq = 1000
-        beep_duration = 0.1
-        beep_interval = 0.2
+        # Bip-bip rapide : bips de 0.1 s toutes les 0.2 s
         sound = np.zeros_like(t)
-        for i in range(int(2 / beep_interval)):
-            start = int(i * beep_interval * SAMPLE_RATE)
-            end = int((i * beep_interval + beep_duration) * SAMPLE_RATE)
-            if end < len(sound):
-                sound[start:end] = np.sin(2 * np.pi * freq * t[start:end])
+        for pulse in dsp.pulse_slices(len(t), 0.1, 0.2):
+            dsp.sine(1000, t[pulse], out=sound[pulse])
     
     elif alert_type == "stall":
         # Son grave pulsé
-        freq = 400
-        sound = np.sin(2 * np.pi * freq * t)
-        modulation = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)
-        sound *= modulation
+        sound = dsp.sine(400, t)
+        sound *= 0.5 + dsp.sine(4, t, 0.5)
     
     elif alert_type == "terrain":
         # "Pull up" simulé avec variation de fréquence
-        freq_start = 600
-        freq_end = 900
-        freq = np.linspace(freq_start, freq_end, len(t))
-        sound = np.sin(2 * np.pi * freq * t)
+        sound = dsp.sine(dsp.ramp(600, 900, len(t)), t)
     
     else:  # generic
-        freq = 800
-        sound = np.sin(2 * np.pi * freq * t)
+        sound = dsp.sine(800, t)
     
     # Envelope pour éviter les clics
-    envelope = np.ones_like(sound)
-    fade_samples = int(0.01 * SAMPLE_RATE)
-    envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
-    envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
-    sound *= envelope
-    
-    # Normaliser
-    sound = sound / np.max(np.abs(sound)) * 0.9
+    sound = dsp.fade(sound, dsp.sample_count(0.01))
     
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return dsp.normalize(sound, 0.9)
 
-def generate_radio_static(filename):
+def generate_radio_static():
     """
     Génère un son de parasites radio
     """
-    t = np.linspace(0, 1, int(SAMPLE_RATE * 1))
+    n = dsp.sample_count(1)
     
     # Bruit blanc filtré
-    noise = np.random.normal(0, 1, len(t))
-    sos = signal.butter(2, [300, 3000], 'bandpass', fs=SAMPLE_RATE, output='sos')
-    sound = signal.sosfilt(sos, noise) * 0.3
-    
-    wavfile.write(filename, SAMPLE_RATE, (sound * 32767).astype(np.int16))
-    print(f"  ✓ {os.path.basename(filename)}")
+    return dsp.bandpass(dsp.gaussian_noise(n), 300, 3000) * 0.3
 
 def main():
-    """Génère tous les sons réalistes"""
-    
+    """Génère tous les sons réalistes décrits dans sound_manifest.py"""
+    import build_sounds
+
     print("=" * 70)
     print("  Génération de sons réalistes pour le simulateur")
     print("=" * 70)
     print()
-    
-    sounds_dir = create_directory()
-    
-    # Sons d'avions légers (moteur à pistons)
-    print("Génération des sons d'avions légers...")
-    generate_propeller_sound(2400, 2, f"{sounds_dir}/cessna172_idle.wav")
-    generate_propeller_sound(2600, 2, f"{sounds_dir}/cessna172_cruise.wav")
-    generate_propeller_sound(2700, 2, f"{sounds_dir}/cessna172_full_throttle.wav")
-    
-    # Sons de jets d'affaires
-    print("\nGénération des sons de jets d'affaires...")
-    generate_jet_sound("idle", f"{sounds_dir}/citation_idle.wav")
-    generate_jet_sound("cruise", f"{sounds_dir}/citation_cruise.wav")
-    generate_jet_sound("full_throttle", f"{sounds_dir}/citation_full_throttle.wav")
-    
-    # Sons d'avions de ligne
-    print("\nGénération des sons d'avions de ligne...")
-    generate_jet_sound("idle", f"{sounds_dir}/a320_idle.wav")
-    generate_jet_sound("cruise", f"{sounds_dir}/a320_cruise.wav")
-    generate_jet_sound("full_throttle", f"{sounds_dir}/a320_full_throttle.wav")
-    
-    # Sons de gros porteurs
-    print("\nGénération des sons de gros porteurs...")
-    generate_jet_sound("idle", f"{sounds_dir}/a380_idle.wav")
-    generate_jet_sound("cruise", f"{sounds_dir}/a380_cruise.wav")
-    generate_jet_sound("full_throttle", f"{sounds_dir}/a380_full_throttle.wav")
-    
-    # Sons d'hélicoptères
-    print("\nGénération des sons d'hélicoptères...")
-    generate_helicopter_rotor(350, f"{sounds_dir}/r22_rotor.wav")
-    generate_helicopter_rotor(400, f"{sounds_dir}/as350_rotor.wav")
-    generate_helicopter_rotor(300, f"{sounds_dir}/chinook_rotor.wav")
-    
-    # Sons d'environnement
-    print("\nGénération des sons d'environnement...")
-    generate_wind_sound("light", f"{sounds_dir}/wind_light.wav")
-    generate_wind_sound("moderate", f"{sounds_dir}/wind_moderate.wav")
-    generate_wind_sound("strong", f"{sounds_dir}/wind_strong.wav")
-    
-    # Sons d'alerte
-    print("\nGénération des sons d'alerte...")
-    generate_alert_sound("altitude", f"{sounds_dir}/altitude_warning.wav")
-    generate_alert_sound("stall", f"{sounds_dir}/stall_warning.wav")
-    generate_alert_sound("terrain", f"{sounds_dir}/terrain_warning.wav")
-    generate_alert_sound("generic", f"{sounds_dir}/generic_warning.wav")
-    
-    # Sons radio
-    print("\nGénération des sons radio...")
-    generate_radio_static(f"{sounds_dir}/radio_static.wav")
-    
+
+    build_sounds.build(modules=["generate_realistic_sounds"])
+
     print()
     print("=" * 70)
     print("  ✓ Tous les sons réalistes ont été générés avec succès!")
-    print(f"  Répertoire: {sounds_dir}")
     print("=" * 70)
 
 if __name__ == "__main__":
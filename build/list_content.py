@@ -1,67 +1,47 @@
 #!/usr/bin/env python3
-import sqlite3
+import catalog
 
-conn = sqlite3.connect('../assets/data/simulator.db')
-c = conn.cursor()
+# Une seule lecture : le catalogue précompilé (reconstruit s'il ne correspond plus à la base)
+content = catalog.load_catalog()
+aircraft_by_type = content.groups("aircraft", "Type")
+airports_by_country = content.groups("airports", "Country")
 
-print("\n=== AVIONS DISPONIBLES ===\n")
-print("Avions légers:")
-for row in c.execute("SELECT Manufacturer, Name FROM Aircraft WHERE Type = 0"):
-    print(f"  • {row[0]} {row[1]}")
-
-print("\nJets d'affaires:")
-for row in c.execute("SELECT Manufacturer, Name FROM Aircraft WHERE Type = 1"):
-    print(f"  • {row[0]} {row[1]}")
-
-print("\nAvions régionaux:")
-for row in c.execute("SELECT Manufacturer, Name FROM Aircraft WHERE Type = 2"):
-    print(f"  • {row[0]} {row[1]}")
-
-print("\nMoyen-courriers:")
-for row in c.execute("SELECT Manufacturer, Name FROM Aircraft WHERE Type = 3"):
-    print(f"  • {row[0]} {row[1]}")
+def aircraft_of_type(aircraft_type):
+    return content.rows("aircraft", aircraft_by_type.get(aircraft_type, []))
 
-print("\nLong-courriers:")
-for row in c.execute("SELECT Manufacturer, Name FROM Aircraft WHERE Type = 4"):
-    print(f"  • {row[0]} {row[1]}")
+def airports_in(countries, limit=None):
+    # Les pays sont des plages contiguës triées par ville : l'ordre Country, City est conservé
+    selection = [i for country in sorted(countries) for i in airports_by_country.get(country, [])]
+    return content.rows("airports", selection[:limit])
 
-print("\nAvions cargo:")
-for row in c.execute("SELECT Manufacturer, Name FROM Aircraft WHERE Type = 5"):
-    print(f"  • {row[0]} {row[1]}")
+print("\n=== AVIONS DISPONIBLES ===\n")
+for aircraft_type, title in [(0, "Avions légers:"), (1, "\nJets d'affaires:"), (2, "\nAvions régionaux:"),
+                             (3, "\nMoyen-courriers:"), (4, "\nLong-courriers:"), (5, "\nAvions cargo:")]:
+    print(title)
+    for row in aircraft_of_type(aircraft_type):
+        print(f"  • {row['Manufacturer']} {row['Name']}")
 
 print("\n=== AÉROPORTS PAR RÉGION ===\n")
 print("France:")
-for row in c.execute("SELECT IataCode, Name, City FROM Airport WHERE Country = 'France' ORDER BY City"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}")
-
-print("\nEurope (hors France) - Sélection:")
-for row in c.execute("SELECT IataCode, Name, City, Country FROM Airport WHERE Country != 'France' AND Country IN ('Royaume-Uni', 'Allemagne', 'Espagne', 'Italie', 'Pays-Bas') ORDER BY Country, City LIMIT 10"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}, {row[3]}")
-
-print("\nAmérique du Nord - Sélection:")
-for row in c.execute("SELECT IataCode, Name, City, Country FROM Airport WHERE Country IN ('États-Unis', 'Canada', 'Mexique') ORDER BY Country, City LIMIT 10"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}, {row[3]}")
-
-print("\nAsie - Sélection:")
-for row in c.execute("SELECT IataCode, Name, City, Country FROM Airport WHERE Country IN ('Japon', 'Chine', 'Singapour', 'Thaïlande', 'Inde', 'Corée du Sud') ORDER BY Country, City LIMIT 10"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}, {row[3]}")
-
-print("\nMoyen-Orient:")
-for row in c.execute("SELECT IataCode, Name, City, Country FROM Airport WHERE Country IN ('Émirats arabes unis', 'Qatar', 'Arabie saoudite', 'Oman', 'Turquie') ORDER BY Country, City"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}, {row[3]}")
-
-print("\nAutres continents:")
-for row in c.execute("SELECT IataCode, Name, City, Country FROM Airport WHERE Country IN ('Australie', 'Nouvelle-Zélande', 'Afrique du Sud', 'Égypte', 'Maroc', 'Brésil', 'Chili', 'Argentine', 'Colombie') ORDER BY Country, City"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}, {row[3]}")
-
-total_aircraft = c.execute("SELECT COUNT(*) FROM Aircraft").fetchone()[0]
-total_airports = c.execute("SELECT COUNT(*) FROM Airport").fetchone()[0]
-total_runways = c.execute("SELECT COUNT(*) FROM Runway").fetchone()[0]
+for row in airports_in(['France']):
+    print(f"  • {row['IataCode']} - {row['Name']}, {row['City']}")
+
+for title, countries, limit in [
+    ("\nEurope (hors France) - Sélection:", ['Royaume-Uni', 'Allemagne', 'Espagne', 'Italie', 'Pays-Bas'], 10),
+    ("\nAmérique du Nord - Sélection:", ['États-Unis', 'Canada', 'Mexique'], 10),
+    ("\nAsie - Sélection:", ['Japon', 'Chine', 'Singapour', 'Thaïlande', 'Inde', 'Corée du Sud'], 10),
+    ("\nMoyen-Orient:", ['Émirats arabes unis', 'Qatar', 'Arabie saoudite', 'Oman', 'Turquie'], None),
+    ("\nAutres continents:", ['Australie', 'Nouvelle-Zélande', 'Afrique du Sud', 'Égypte', 'Maroc', 'Brésil', 'Chili', 'Argentine', 'Colombie'], None),
+]:
+    print(title)
+    for row in airports_in(countries, limit):
+        print(f"  • {row['IataCode']} - {row['Name']}, {row['City']}, {row['Country']}")
+
+total_aircraft = content.count("aircraft")
+total_airports = content.count("airports")
+total_runways = content.count("runways")
 
 print(f"\n=== STATISTIQUES ===")
 print(f"Total avions: {total_aircraft}")
 print(f"Total aéroports: {total_airports}")
 print(f"Total pistes: {total_runways}")
-
-conn.close()
-
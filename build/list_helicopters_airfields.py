@@ -1,74 +1,78 @@
 #!/usr/bin/env python3
-import sqlite3
+import catalog
 
-conn = sqlite3.connect('../assets/data/simulator.db')
-c = conn.cursor()
+# Une seule lecture : le catalogue précompilé (reconstruit s'il ne correspond plus à la base)
+content = catalog.load_catalog()
 
 print("\n" + "=" * 70)
 print("  HÉLICOPTÈRES DISPONIBLES")
 print("=" * 70 + "\n")
 
-print("Hélicoptères légers (3 modèles):")
-for row in c.execute("SELECT Manufacturer, Name, PassengerCapacity FROM Aircraft WHERE Type = 6 AND PassengerCapacity <= 4 ORDER BY PassengerCapacity"):
-    print(f"  • {row[0]} {row[1]} - {row[2]} passagers")
-
-print("\nHélicoptères utilitaires (4 modèles):")
-for row in c.execute("SELECT Manufacturer, Name, PassengerCapacity FROM Aircraft WHERE Type = 6 AND PassengerCapacity BETWEEN 5 AND 6 ORDER BY PassengerCapacity"):
-    print(f"  • {row[0]} {row[1]} - {row[2]} passagers")
-
-print("\nHélicoptères bimoteurs moyens (4 modèles):")
-for row in c.execute("SELECT Manufacturer, Name, PassengerCapacity FROM Aircraft WHERE Type = 6 AND PassengerCapacity BETWEEN 12 AND 15 ORDER BY PassengerCapacity"):
-    print(f"  • {row[0]} {row[1]} - {row[2]} passagers")
-
-print("\nHélicoptères lourds (3 modèles):")
-for row in c.execute("SELECT Manufacturer, Name, PassengerCapacity FROM Aircraft WHERE Type = 6 AND PassengerCapacity BETWEEN 19 AND 30 ORDER BY PassengerCapacity"):
-    print(f"  • {row[0]} {row[1]} - {row[2]} passagers")
-
-print("\nHélicoptères militaires/utilitaires lourds (3 modèles):")
-for row in c.execute("SELECT Manufacturer, Name, PassengerCapacity FROM Aircraft WHERE Type = 6 AND PassengerCapacity > 30 ORDER BY PassengerCapacity"):
-    print(f"  • {row[0]} {row[1]} - {row[2]} passagers")
+# Un passage sur le groupe des hélicoptères, réparti par capacité
+helicopter_sections = [
+    ("Hélicoptères légers (3 modèles):", lambda p: p <= 4),
+    ("\nHélicoptères utilitaires (4 modèles):", lambda p: 5 <= p <= 6),
+    ("\nHélicoptères bimoteurs moyens (4 modèles):", lambda p: 12 <= p <= 15),
+    ("\nHélicoptères lourds (3 modèles):", lambda p: 19 <= p <= 30),
+    ("\nHélicoptères militaires/utilitaires lourds (3 modèles):", lambda p: p > 30),
+]
+helicopter_rows = [[] for _ in helicopter_sections]
+helicopters = content.groups("aircraft", "Type").get(6, [])
+for row in content.rows("aircraft", helicopters):
+    for rows, (_, matches) in zip(helicopter_rows, helicopter_sections):
+        if matches(row['PassengerCapacity']):
+            rows.append(row)
+
+for rows, (title, _) in zip(helicopter_rows, helicopter_sections):
+    print(title)
+    for row in sorted(rows, key=lambda r: r['PassengerCapacity']):
+        print(f"  • {row['Manufacturer']} {row['Name']} - {row['PassengerCapacity']} passagers")
 
 print("\n" + "=" * 70)
 print("  AÉRODROMES PAR RÉGION")
 print("=" * 70 + "\n")
 
-print("Aérodromes région parisienne:")
-for row in c.execute("SELECT IataCode, Name, City FROM Airport WHERE Size = 0 AND Country = 'France' AND (City LIKE '%Paris%' OR City LIKE '%Le Bourget%' OR City LIKE '%Toussus%' OR City LIKE '%Pontoise%' OR City LIKE '%Villacoublay%' OR City LIKE '%Lognes%') ORDER BY City"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}")
-
-print("\nAérodromes Sud de la France:")
-for row in c.execute("SELECT IataCode, Name, City FROM Airport WHERE Size = 0 AND Country = 'France' AND City IN ('Cannes', 'Avignon', 'Toulon', 'Carcassonne') ORDER BY City"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}")
-
-print("\nAérodromes Ouest de la France:")
-for row in c.execute("SELECT IataCode, Name, City FROM Airport WHERE Size = 0 AND Country = 'France' AND City IN ('Biarritz', 'Brest', 'La Rochelle', 'Rennes', 'Angers', 'Cholet') ORDER BY City"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}")
-
-print("\nAérodromes Centre et Est de la France:")
-for row in c.execute("SELECT IataCode, Name, City FROM Airport WHERE Size = 0 AND Country = 'France' AND City IN ('Auxerre', 'Tours', 'Metz', 'Roanne', 'Brive', 'Cognac') ORDER BY City"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}")
-
-print("\nAérodromes montagne:")
-for row in c.execute("SELECT IataCode, Name, City FROM Airport WHERE Size = 0 AND Country = 'France' AND City IN ('Chambéry', 'Courchevel', 'Grenoble', 'Pau', 'Lourdes') ORDER BY City"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}")
-
-print("\nAérodromes DOM-TOM:")
-for row in c.execute("SELECT IataCode, Name, City, Country FROM Airport WHERE Size IN (0,1) AND Country IN ('Martinique', 'Guadeloupe', 'Saint-Martin') ORDER BY Country, City"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}, {row[3]}")
-
-print("\nAérodromes Europe:")
-for row in c.execute("SELECT IataCode, Name, City, Country FROM Airport WHERE Size = 0 AND Country != 'France' AND Country NOT IN ('Martinique', 'Guadeloupe', 'Saint-Martin') ORDER BY Country, City"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}, {row[3]}")
-
-print("\nAérodromes Nord de la France:")
-for row in c.execute("SELECT IataCode, Name, City FROM Airport WHERE Size IN (0,1) AND Country = 'France' AND City = 'Lille' ORDER BY City"):
-    print(f"  • {row[0]} - {row[1]}, {row[2]}")
+def in_france(cities):
+    return lambda a: a['Size'] == 0 and a['Country'] == 'France' and a['City'] in cities
+
+paris_cities = ['Paris', 'Le Bourget', 'Toussus', 'Pontoise', 'Villacoublay', 'Lognes']
+overseas = ['Martinique', 'Guadeloupe', 'Saint-Martin']
+
+# Un passage sur les aéroports (triés par pays, ville, nom), réparti par région
+airfield_sections = [
+    ("Aérodromes région parisienne:", False,
+     lambda a: a['Size'] == 0 and a['Country'] == 'France' and any(c in a['City'] for c in paris_cities)),
+    ("\nAérodromes Sud de la France:", False, in_france(['Cannes', 'Avignon', 'Toulon', 'Carcassonne'])),
+    ("\nAérodromes Ouest de la France:", False,
+     in_france(['Biarritz', 'Brest', 'La Rochelle', 'Rennes', 'Angers', 'Cholet'])),
+    ("\nAérodromes Centre et Est de la France:", False,
+     in_france(['Auxerre', 'Tours', 'Metz', 'Roanne', 'Brive', 'Cognac'])),
+    ("\nAérodromes montagne:", False, in_france(['Chambéry', 'Courchevel', 'Grenoble', 'Pau', 'Lourdes'])),
+    ("\nAérodromes DOM-TOM:", True, lambda a: a['Size'] in (0, 1) and a['Country'] in overseas),
+    ("\nAérodromes Europe:", True,
+     lambda a: a['Size'] == 0 and a['Country'] != 'France' and a['Country'] not in overseas),
+    ("\nAérodromes Nord de la France:", False,
+     lambda a: a['Size'] in (0, 1) and a['Country'] == 'France' and a['City'] == 'Lille'),
+]
+airfield_rows = [[] for _ in airfield_sections]
+for row in content.rows("airports"):
+    for rows, (_, _, matches) in zip(airfield_rows, airfield_sections):
+        if matches(row):
+            rows.append(row)
+
+for rows, (title, with_country, _) in zip(airfield_rows, airfield_sections):
+    print(title)
+    for row in rows:
+        if with_country:
+            print(f"  • {row['IataCode']} - {row['Name']}, {row['City']}, {row['Country']}")
+        else:
+            print(f"  • {row['IataCode']} - {row['Name']}, {row['City']}")
 
 # Statistiques
-total_helicopters = c.execute("SELECT COUNT(*) FROM Aircraft WHERE Type = 6").fetchone()[0]
-total_airfields = c.execute("SELECT COUNT(*) FROM Airport WHERE Size = 0").fetchone()[0]
-total_aircraft = c.execute("SELECT COUNT(*) FROM Aircraft").fetchone()[0]
-total_airports = c.execute("SELECT COUNT(*) FROM Airport").fetchone()[0]
+total_helicopters = len(helicopters)
+total_airfields = len(content.groups("airports", "Size").get(0, []))
+total_aircraft = content.count("aircraft")
+total_airports = content.count("airports")
 
 print("\n" + "=" * 70)
 print("  STATISTIQUES GLOBALES")
@@ -78,6 +82,3 @@ print(f"Aérodromes: {total_airfields}")
 print(f"\nTotal appareils (avions + hélicoptères): {total_aircraft}")
 print(f"Total sites (aéroports + aérodromes): {total_airports}")
 print("=" * 70 + "\n")
-
-conn.close()
-
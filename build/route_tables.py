@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Tables de routes précalculées
+Calcule la distance orthodromique entre toutes les paires d'aéroports et l'index
+des paires accessibles à chaque avion, puis les interroge sans aucun calcul de trigonométrie
+
+Fichiers produits dans assets/data/routes/ :
+  distances.npy         distances en miles nautiques (float32), triangle supérieur
+                        condensé : la paire (i, j), i < j, est à l'indice
+                        i * n - i * (i + 1) / 2 + j - i - 1
+  pairs_by_distance.npy indices condensés des paires triés par distance croissante
+                        (tri par paquets sur disque, en mémoire bornée)
+  routes.json           aéroports dans l'ordre des tables, avions (distance maximale,
+                        limitée par l'autonomie et le carburant) et nombre de paires
+                        accessibles, empreinte de la base utilisée
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+import build_profile
+import seed_database
+
+BUILD_DIR = os.path.dirname(os.path.abspath(__file__))
+ROUTES_DIR = os.path.normpath(os.path.join(BUILD_DIR, "..", "assets", "data", "routes"))
+
+DISTANCES_FILE = "distances.npy"
+PAIRS_FILE = "pairs_by_distance.npy"
+INDEX_FILE = "routes.json"
+
+# Rayon moyen de la Terre en miles nautiques (comme Airport.DistanceTo)
+EARTH_RADIUS_NM = 3440.065
+
+# Réserve de carburant ajoutée à chaque vol (heures de croisière)
+FUEL_RESERVE_HOURS = 0.75
+
+# Tri des paires par paquets : mémoire de travail bornée quel que soit le nombre d'aéroports
+SORT_CHUNK = 1 << 22          # paires lues à la fois
+SORT_BUCKET = 1 << 24         # paires triées en mémoire à la fois (environ)
+HISTOGRAM_BINS = 1 << 20      # classes de distance servant à découper les paquets
+
+# --- Indices du triangle supérieur condensé ---
+
+def pair_count(n):
+    """Nombre de paires d'aéroports distinctes"""
+    return n * (n - 1) // 2
+
+def row_offset(i, n):
+    """Indice condensé de la paire (i, i + 1)"""
+    return i * n - i * (i + 1) // 2
+
+def pair_index(i, j, n):
+    """Indice condensé de la paire (i, j) dans un sens ou dans l'autre (i != j)"""
+    low = np.minimum(i, j)
+    high = np.maximum(i, j)
+    return row_offset(low, n) + high - low - 1
+
+def pair_from_index(k, n):
+    """Paires (i, j), i < j, correspondant à des indices condensés"""
+    k = np.asarray(k, dtype=np.int64)
+    i = n - 2 - np.floor(np.sqrt(-8.0 * k + 4.0 * n * (n - 1) - 7) / 2 - 0.5).astype(np.int64)
+    j = k + i + 1 - row_offset(i, n)
+    return i, j
+
+# --- Calcul ---
+
+def distance_matrix(latitudes, longitudes, out=None):
+    """
+    Distances orthodromiques entre toutes les paires (triangle supérieur condensé)
+    Calcul vectorisé ligne par ligne : la mémoire de travail ne dépend que de n
+    """
+    n = len(latitudes)
+    phi = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lam = np.radians(np.asarray(longitudes, dtype=np.float64))
+    cos_phi = np.cos(phi)
+    if out is None:
+        out = np.empty(pair_count(n), dtype=np.float32)
+
+    for i in range(n - 1):
+        a = (np.sin((phi[i + 1:] - phi[i]) / 2) ** 2
+             + cos_phi[i] * cos_phi[i + 1:] * np.sin((lam[i + 1:] - lam[i]) / 2) ** 2)
+        start = row_offset(i, n)
+        out[start:start + n - 1 - i] = 2 * EARTH_RADIUS_NM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    return out
+
+def sort_pairs(distances, out, work_path, limits):
+    """
+    Trie les indices condensés des paires par distance croissante dans out (memmap)
+    Tri par paquets sur disque, en mémoire bornée par SORT_CHUNK et SORT_BUCKET :
+      1. histogramme des distances, découpé en paquets de distances contiguës
+      2. chaque paire est copiée dans la zone de son paquet (indice et distance,
+         celle-ci dans le fichier de travail work_path)
+      3. chaque paquet est trié en mémoire
+    limits : distances maximales ; retourne le nombre de paires sous chaque limite
+    """
+    count = len(distances)
+    scale = HISTOGRAM_BINS / (np.pi * EARTH_RADIUS_NM * 1.001)
+    chunks = range(0, count, SORT_CHUNK)
+
+    def fine_bins(d):
+        return np.minimum((d * scale).astype(np.int64), HISTOGRAM_BINS - 1)
+
+    histogram = np.zeros(HISTOGRAM_BINS, dtype=np.int64)
+    for start in chunks:
+        histogram += np.bincount(fine_bins(distances[start:start + SORT_CHUNK]), minlength=HISTOGRAM_BINS)
+
+    # Paquets : classes consécutives regroupées par tranches d'environ SORT_BUCKET paires
+    _, bucket_of_bin = np.unique((np.cumsum(histogram) - histogram) // SORT_BUCKET, return_inverse=True)
+    bucket_sizes = np.bincount(bucket_of_bin, weights=histogram, minlength=bucket_of_bin.max() + 1).astype(np.int64)
+    bucket_starts = np.cumsum(bucket_sizes) - bucket_sizes
+    cursors = bucket_starts.copy()
+
+    keys = np.lib.format.open_memmap(work_path, mode="w+", dtype=np.float32, shape=(count,))
+    try:
+        for start in chunks:
+            d = np.asarray(distances[start:start + SORT_CHUNK])
+            buckets = bucket_of_bin[fine_bins(d)]
+            order = np.argsort(buckets, kind="stable")
+            counts = np.bincount(buckets, minlength=len(bucket_sizes))
+            offsets = np.cumsum(counts) - counts
+            for bucket in np.flatnonzero(counts):
+                selection = order[offsets[bucket]:offsets[bucket] + counts[bucket]]
+                position = cursors[bucket]
+                out[position:position + len(selection)] = selection + start
+                keys[position:position + len(selection)] = d[selection]
+                cursors[bucket] += len(selection)
+
+        reachable = np.zeros(len(limits), dtype=np.int64)
+        for start, size in zip(bucket_starts, bucket_sizes):
+            bucket_keys = np.asarray(keys[start:start + size])
+            order = np.argsort(bucket_keys)
+            out[start:start + size] = np.asarray(out[start:start + size])[order]
+            reachable += np.searchsorted(bucket_keys[order], limits, side="right")
+        out.flush()
+    finally:
+        del keys
+        os.remove(work_path)
+    return reachable
+
+def fuel_model(aircraft):
+    """Carburant nécessaire à un vol : (litres par mile nautique, litres de réserve)"""
+    per_nm = aircraft["FuelConsumption"] / aircraft["CruiseSpeed"]
+    return per_nm, aircraft["FuelConsumption"] * FUEL_RESERVE_HOURS
+
+def max_distance(aircraft):
+    """
+    Distance maximale d'une étape : autonomie (Range), limitée par le carburant
+    emportable une fois la réserve déduite (FuelCapacity)
+    """
+    per_nm, reserve = fuel_model(aircraft)
+    return max(0.0, min(aircraft["Range"], (aircraft["FuelCapacity"] - reserve) / per_nm))
+
+def load_airports(conn):
+    """Aéroports dans l'ordre des tables : (codes OACI, latitudes, longitudes)"""
+    rows = conn.execute("SELECT IcaoCode, Latitude, Longitude FROM Airport ORDER BY IcaoCode").fetchall()
+    icao = [r[0] for r in rows]
+    return icao, np.array([r[1] for r in rows]), np.array([r[2] for r in rows])
+
+def load_aircraft(conn):
+    """Caractéristiques des avions utilisées par les tables de routes"""
+    columns = ["Id", "Range", "CruiseSpeed", "FuelConsumption", "FuelCapacity"]
+    query = f"SELECT {', '.join(columns)} FROM Aircraft ORDER BY Id"
+    return [dict(zip(columns, row)) for row in conn.execute(query)]
+
+def tables_key(conn):
+    """Version des tables : contenu des avions et aéroports, code de ce script"""
+    with open(os.path.abspath(__file__), "rb") as f:
+        code = hashlib.sha256(f.read()).hexdigest()
+    return hashlib.sha256(
+        (seed_database.content_hash(conn, ("Aircraft", "Airport")) + code).encode("utf-8")
+    ).hexdigest()
+
+def read_index(routes_dir=ROUTES_DIR):
+    """Index des tables de routes, ou None s'il n'existe pas"""
+    try:
+        with open(os.path.join(routes_dir, INDEX_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def build_route_tables(db_path=seed_database.DB_PATH, routes_dir=ROUTES_DIR, force=False):
+    """
+    Calcule les tables de routes si la base a changé depuis le dernier calcul
+    Retourne l'index écrit, ou None si les tables étaient à jour
+    """
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        key = tables_key(conn)
+        index = read_index(routes_dir)
+        files_present = all(os.path.exists(os.path.join(routes_dir, name))
+                            for name in (DISTANCES_FILE, PAIRS_FILE))
+        if not force and files_present and index is not None and index.get("key") == key:
+            return None
+        airports, latitudes, longitudes = load_airports(conn)
+        aircraft = load_aircraft(conn)
+    finally:
+        conn.close()
+
+    os.makedirs(routes_dir, exist_ok=True)
+    n = len(airports)
+    count = pair_count(n)
+
+    # Distances écrites directement dans le fichier projeté en mémoire
+    distances_tmp = os.path.join(routes_dir, DISTANCES_FILE + ".tmp")
+    with build_profile.stage("distances", "db") as metrics:
+        distances = np.lib.format.open_memmap(distances_tmp, mode="w+", dtype=np.float32, shape=(count,))
+        distance_matrix(latitudes, longitudes, out=distances)
+        distances.flush()
+        metrics["rows"] = count
+        metrics["bytes_written"] = os.path.getsize(distances_tmp)
+
+    # Paires par distance croissante : les paires accessibles à un avion sont un préfixe
+    pairs_tmp = os.path.join(routes_dir, PAIRS_FILE + ".tmp")
+    with build_profile.stage("reachability", "db") as metrics:
+        order_dtype = np.uint32 if count < 2**32 else np.uint64
+        order = np.lib.format.open_memmap(pairs_tmp, mode="w+", dtype=order_dtype, shape=(count,))
+        limits = np.array([max_distance(plane) for plane in aircraft], dtype=np.float64)
+        reachable = sort_pairs(distances, order, os.path.join(routes_dir, "sort.tmp"), limits)
+
+        aircraft_index = {}
+        for plane, limit, pairs in zip(aircraft, limits, reachable):
+            per_nm, reserve = fuel_model(plane)
+            aircraft_index[plane["Id"]] = {
+                "range": plane["Range"],
+                "fuel_capacity": plane["FuelCapacity"],
+                "fuel_per_nm": per_nm,
+                "fuel_reserve": reserve,
+                "max_distance": float(limit),
+                "reachable_pairs": int(pairs),
+            }
+        del distances, order
+
+        metrics["rows"] = len(aircraft_index)
+        metrics["bytes_written"] = os.path.getsize(pairs_tmp)
+
+    index = {
+        "key": key,
+        "earth_radius_nm": EARTH_RADIUS_NM,
+        "fuel_reserve_hours": FUEL_RESERVE_HOURS,
+        "airports": airports,
+        "aircraft": aircraft_index,
+    }
+    index_tmp = os.path.join(routes_dir, INDEX_FILE + ".tmp")
+    with open(index_tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+
+    # L'index est remplacé en dernier : il ne désigne jamais des tables incomplètes
+    os.replace(distances_tmp, os.path.join(routes_dir, DISTANCES_FILE))
+    os.replace(pairs_tmp, os.path.join(routes_dir, PAIRS_FILE))
+    os.replace(index_tmp, os.path.join(routes_dir, INDEX_FILE))
+    return index
+
+class RouteTables:
+    """
+    Interrogation des tables de routes (fichiers projetés en mémoire)
+    Distances en miles nautiques, carburant en litres (réserve comprise)
+    Un avion peut effectuer une étape si elle ne dépasse ni son autonomie (Range),
+    ni la distance permise par son carburant réserve comprise (max_distance)
+    """
+
+    def __init__(self, routes_dir=ROUTES_DIR):
+        index = read_index(routes_dir)
+        if index is None:
+            raise FileNotFoundError(f"Tables de routes absentes : {routes_dir} (lancer route_tables.py)")
+        self.airports = index["airports"]
+        self.aircraft = index["aircraft"]
+        self._positions = {icao: i for i, icao in enumerate(self.airports)}
+        self._distances = np.load(os.path.join(routes_dir, DISTANCES_FILE), mmap_mode="r")
+        self._pairs = np.load(os.path.join(routes_dir, PAIRS_FILE), mmap_mode="r")
+
+    def _position(self, icao):
+        """Position d'un aéroport dans les tables"""
+        try:
+            return self._positions[icao]
+        except KeyError:
+            raise KeyError(f"Aéroport inconnu : {icao}") from None
+
+    def distance(self, origin, destination):
+        """Distance entre deux aéroports"""
+        i = self._position(origin)
+        j = self._position(destination)
+        if i == j:
+            return 0.0
+        return float(self._distances[pair_index(i, j, len(self.airports))])
+
+    def required_fuel(self, aircraft_id, distance):
+        """Carburant nécessaire à un avion pour parcourir une distance"""
+        plane = self.aircraft[aircraft_id]
+        return plane["fuel_per_nm"] * distance + plane["fuel_reserve"]
+
+    def can_fly(self, aircraft_id, origin, destination):
+        """Indique si un avion peut relier deux aéroports"""
+        return self.distance(origin, destination) <= self.aircraft[aircraft_id]["max_distance"]
+
+    def aircraft_for_route(self, origin, destination):
+        """Avions capables de relier deux aéroports, avec le carburant nécessaire"""
+        distance = self.distance(origin, destination)
+        return [(aircraft_id, self.required_fuel(aircraft_id, distance))
+                for aircraft_id, plane in self.aircraft.items()
+                if distance <= plane["max_distance"]]
+
+    def destinations(self, aircraft_id, origin):
+        """
+        Aéroports accessibles depuis origin pour un avion
+        Liste de (code OACI, distance, carburant nécessaire), du plus proche au plus loin
+        """
+        n = len(self.airports)
+        i = self._position(origin)
+        others = np.delete(np.arange(n), i)
+        distances = self._distances[pair_index(i, others, n)]
+        reachable = distances <= self.aircraft[aircraft_id]["max_distance"]
+        others = others[reachable]
+        distances = distances[reachable]
+        order = np.argsort(distances, kind="stable")
+        return [(self.airports[j], float(d), self.required_fuel(aircraft_id, float(d)))
+                for j, d in zip(others[order], distances[order])]
+
+    def reachable_pairs(self, aircraft_id):
+        """
+        Toutes les paires accessibles à un avion, par distance croissante
+        Retourne des tableaux (origines, destinations, distances) d'indices dans airports
+        """
+        k = self._pairs[:self.aircraft[aircraft_id]["reachable_pairs"]]
+        origins, destinations = pair_from_index(k, len(self.airports))
+        return origins, destinations, self._distances[k]
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Calcule les tables de routes")
+    parser.add_argument("--db", default=seed_database.DB_PATH, help="chemin de la base SQLite")
+    parser.add_argument("--output", default=ROUTES_DIR, help="dossier des tables")
+    parser.add_argument("--force", action="store_true", help="recalcule même si la base n'a pas changé")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("  Tables de routes")
+    print("=" * 70)
+    print()
+
+    start = time.perf_counter()
+    index = build_route_tables(args.db, args.output, args.force)
+    elapsed = time.perf_counter() - start
+
+    if index is None:
+        print(f"✓ Tables de routes déjà à jour : {args.output}")
+        return
+
+    n = len(index["airports"])
+    print(f"  ✓ {pair_count(n)} distances entre {n} aéroports")
+    for aircraft_id, plane in index["aircraft"].items():
+        print(f"  ✓ {aircraft_id}: {plane['reachable_pairs']} paires accessibles")
+    print(f"\n✓ Tables de routes écrites en {elapsed:.2f} s : {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Remplissage de la base de données à partir de fichiers de données
+Lit les avions, aéroports et pistes en flux depuis des fichiers CSV/JSON et les
+insère ou met à jour par lots dans une seule transaction : relancer le script
+ne crée aucun doublon et une exécution interrompue laisse la base intacte
+"""
+
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+import build_profile
+
+BUILD_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.normpath(os.path.join(BUILD_DIR, "..", "assets", "data", "simulator.db"))
+SEED_DIR = os.path.normpath(os.path.join(BUILD_DIR, "..", "assets", "data", "seed"))
+
+# Nombre de lignes par appel à executemany
+BATCH_SIZE = 10000
+
+# Colonnes de chaque table (Runway : sans l'identifiant auto-incrémenté)
+AIRCRAFT_COLUMNS = [
+    "Id", "Name", "Manufacturer", "Type", "MaxSpeed", "CruiseSpeed", "MaxAltitude", "Range",
+    "FuelCapacity", "FuelConsumption", "PassengerCapacity", "EmptyWeight", "MaxTakeoffWeight",
+    "TakeoffSpeed", "LandingSpeed", "ClimbRate", "DescentRate", "TurnRate", "EngineCount",
+    "EngineType", "EngineSound", "CabinSound",
+]
+AIRPORT_COLUMNS = [
+    "IcaoCode", "IataCode", "Name", "City", "Country", "Latitude", "Longitude", "Elevation",
+    "Size", "HasILS", "HasTower", "TowerFrequency", "GroundFrequency", "AtisFrequency",
+]
+RUNWAY_COLUMNS = ["AirportIcao", "Designation", "Length", "Width", "Surface", "HasLights", "HasILS"]
+
+# Clé naturelle de chaque table, utilisée pour les mises à jour
+TABLE_KEYS = {
+    "Aircraft": ["Id"],
+    "Airport": ["IcaoCode"],
+    "Runway": ["AirportIcao", "Designation"],
+}
+TABLE_COLUMNS = {
+    "Aircraft": AIRCRAFT_COLUMNS,
+    "Airport": AIRPORT_COLUMNS,
+    "Runway": RUNWAY_COLUMNS,
+}
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS Aircraft (
+        Id TEXT PRIMARY KEY,
+        Name TEXT NOT NULL,
+        Manufacturer TEXT NOT NULL,
+        Type INTEGER NOT NULL,
+        MaxSpeed REAL NOT NULL,
+        CruiseSpeed REAL NOT NULL,
+        MaxAltitude REAL NOT NULL,
+        Range REAL NOT NULL,
+        FuelCapacity REAL NOT NULL,
+        FuelConsumption REAL NOT NULL,
+        PassengerCapacity INTEGER NOT NULL,
+        EmptyWeight REAL NOT NULL,
+        MaxTakeoffWeight REAL NOT NULL,
+        TakeoffSpeed REAL NOT NULL,
+        LandingSpeed REAL NOT NULL,
+        ClimbRate REAL NOT NULL,
+        DescentRate REAL NOT NULL,
+        TurnRate REAL NOT NULL,
+        EngineCount INTEGER NOT NULL,
+        EngineType TEXT NOT NULL,
+        EngineSound TEXT,
+        CabinSound TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS Airport (
+        IcaoCode TEXT PRIMARY KEY,
+        IataCode TEXT,
+        Name TEXT NOT NULL,
+        City TEXT NOT NULL,
+        Country TEXT NOT NULL,
+        Latitude REAL NOT NULL,
+        Longitude REAL NOT NULL,
+        Elevation REAL NOT NULL,
+        Size INTEGER NOT NULL,
+        HasILS INTEGER NOT NULL,
+        HasTower INTEGER NOT NULL,
+        TowerFrequency TEXT,
+        GroundFrequency TEXT,
+        AtisFrequency TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS Runway (
+        Id INTEGER PRIMARY KEY AUTOINCREMENT,
+        AirportIcao TEXT NOT NULL,
+        Designation TEXT NOT NULL,
+        Length INTEGER NOT NULL,
+        Width INTEGER NOT NULL,
+        Surface TEXT NOT NULL,
+        HasLights INTEGER NOT NULL,
+        HasILS INTEGER NOT NULL,
+        FOREIGN KEY (AirportIcao) REFERENCES Airport(IcaoCode)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS Metadata (
+        Key TEXT PRIMARY KEY,
+        Value TEXT NOT NULL
+    )
+    """,
+]
+
+# Empreinte du contenu enregistrée dans Metadata à chaque remplissage
+# (le simulateur l'efface dès qu'il modifie les tables)
+CONTENT_HASH_KEY = "ContentHash"
+
+# Index R*Tree des aéroports : un point par aéroport en 5 dimensions (latitude,
+# longitude, taille, ILS, plus grande piste en milliers de pieds) pour que les filtres
+# élaguent l'arbre comme la position. Les colonnes auxiliaires (+) gardent l'OACI et
+# les valeurs exactes (l'arbre arrondit ses coordonnées en float32)
+SPATIAL_INDEX = "AirportRTree"
+SPATIAL_RUNWAY_SCALE = 1000.0
+SPATIAL_INDEX_SCHEMA = f"""
+    CREATE VIRTUAL TABLE {SPATIAL_INDEX} USING rtree(
+        Id,
+        MinLat, MaxLat,
+        MinLon, MaxLon,
+        MinSize, MaxSize,
+        MinILS, MaxILS,
+        MinRunway, MaxRunway,
+        +IcaoCode TEXT,
+        +Latitude REAL,
+        +Longitude REAL,
+        +MaxRunwayLength INTEGER
+    )
+"""
+
+def open_database(db_path=DB_PATH):
+    """Ouvre la base avec des réglages adaptés au chargement en masse"""
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+    # Transactions gérées explicitement (BEGIN/COMMIT)
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA cache_size = -262144")  # 256 Mo
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+def close_database(conn):
+    """Referme la base en un seul fichier, prêt à être distribué"""
+    conn.execute("PRAGMA optimize")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    # Le mode WAL laisse des fichiers -wal/-shm à côté de la base et exige
+    # un dossier accessible en écriture : revenir au journal classique
+    conn.execute("PRAGMA journal_mode = DELETE")
+    conn.close()
+
+def ensure_schema(conn):
+    """
+    Crée les tables et la clé naturelle des pistes (aéroport, désignation)
+    Les doublons laissés par les anciens scripts sont supprimés au passage
+    """
+    for statement in SCHEMA:
+        conn.execute(statement)
+    conn.execute("""
+        DELETE FROM Runway WHERE Id NOT IN (
+            SELECT MIN(Id) FROM Runway GROUP BY AirportIcao, Designation
+        )
+    """)
+    conn.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS IX_Runway_Airport_Designation
+        ON Runway (AirportIcao, Designation)
+    """)
+
+def hilbert_key(latitude, longitude, order=16):
+    """Position d'un point sur une courbe de Hilbert de 2^order x 2^order cases"""
+    side = 1 << order
+    x = int((longitude + 180) / 360 * (side - 1))
+    y = int((latitude + 90) / 180 * (side - 1))
+    key = 0
+    s = side >> 1
+    while s:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        key += s * s * ((3 * rx) ^ ry)
+        if not ry:
+            if rx:
+                x = s - 1 - x
+                y = s - 1 - y
+            x, y = y, x
+        s >>= 1
+    return key
+
+def rebuild_spatial_index(conn):
+    """
+    Reconstruit l'index spatial des aéroports à partir des tables Airport et Runway
+    (longueur de la plus grande piste de chaque aéroport comprise)
+    L'index est entièrement dérivé : il est recréé à chaque fois, en insérant les
+    aéroports dans l'ordre d'une courbe de Hilbert pour que les nœuds de l'arbre
+    regroupent des aéroports voisins (requêtes plus de 20 fois plus rapides
+    qu'avec l'ordre de la table)
+    """
+    rows = conn.execute(f"""
+        SELECT a.rowid, a.Latitude, a.Latitude, a.Longitude, a.Longitude,
+               a.Size, a.Size, a.HasILS, a.HasILS,
+               COALESCE(r.MaxLength, 0) / {SPATIAL_RUNWAY_SCALE},
+               COALESCE(r.MaxLength, 0) / {SPATIAL_RUNWAY_SCALE},
+               a.IcaoCode, a.Latitude, a.Longitude, COALESCE(r.MaxLength, 0)
+        FROM Airport a
+        LEFT JOIN (SELECT AirportIcao, MAX(Length) AS MaxLength
+                   FROM Runway GROUP BY AirportIcao) r
+               ON r.AirportIcao = a.IcaoCode
+    """).fetchall()
+    rows.sort(key=lambda row: hilbert_key(row[1], row[3]))
+
+    conn.execute(f"DROP TABLE IF EXISTS {SPATIAL_INDEX}")
+    conn.execute(SPATIAL_INDEX_SCHEMA)
+    conn.executemany(f"INSERT INTO {SPATIAL_INDEX} VALUES ({', '.join('?' * 15)})", rows)
+    return len(rows)
+
+@contextmanager
+def bulk_transaction(db_path=DB_PATH):
+    """
+    Ouvre la base, vérifie le schéma et exécute le bloc dans une seule transaction
+    L'index spatial et l'empreinte du contenu sont mis à jour avant la validation
+    En cas d'erreur, la transaction est annulée et la base reste inchangée
+    """
+    conn = open_database(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            ensure_schema(conn)
+            yield conn
+            with build_profile.stage("spatial_index", "db") as metrics:
+                metrics["rows"] = rebuild_spatial_index(conn)
+            with build_profile.stage("content_hash", "db"):
+                conn.execute("INSERT OR REPLACE INTO Metadata (Key, Value) VALUES (?, ?)",
+                             (CONTENT_HASH_KEY, content_hash(conn)))
+            with build_profile.stage("commit", "db"):
+                conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        with build_profile.stage("close", "db"):
+            close_database(conn)
+
+def upsert_sql(table):
+    """Requête d'insertion ou de mise à jour sur la clé naturelle de la table"""
+    columns = TABLE_COLUMNS[table]
+    keys = TABLE_KEYS[table]
+    updates = ", ".join(f"{c} = excluded.{c}" for c in columns if c not in keys)
+    return (f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {updates}")
+
+def upsert_rows(conn, table, rows):
+    """
+    Insère ou met à jour des lignes (tuples dans l'ordre des colonnes) par lots
+    Retourne le nombre de lignes traitées
+    """
+    sql = upsert_sql(table)
+    rows = iter(rows)
+    with build_profile.stage(table, "db") as metrics:
+        metrics["rows"] = 0
+        while True:
+            batch = list(itertools.islice(rows, BATCH_SIZE))
+            if not batch:
+                return metrics["rows"]
+            conn.executemany(sql, batch)
+            metrics["rows"] += len(batch)
+
+def records_to_rows(records, columns):
+    """Convertit des enregistrements (dictionnaires) en tuples ordonnés"""
+    for record in records:
+        yield tuple(record.get(column) for column in columns)
+
+def read_records(path):
+    """
+    Lit un fichier de données en flux : CSV (en-tête = noms de colonnes),
+    JSON Lines (.jsonl, un objet par ligne) ou JSON (tableau d'objets)
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if extension == ".csv":
+            yield from csv.DictReader(f)
+        elif extension == ".jsonl":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif extension == ".json":
+            yield from json.load(f)
+        else:
+            raise ValueError(f"Format de données non pris en charge : {path}")
+
+def content_hash(conn, tables=("Aircraft", "Airport", "Runway")):
+    """
+    Empreinte du contenu des tables, indépendante de l'ordre d'insertion
+    Sert de version aux fichiers dérivés de la base (tables de routes, catalogue...)
+    """
+    digest = hashlib.sha256()
+    for table in tables:
+        columns = TABLE_COLUMNS[table]
+        digest.update(f"{table}({', '.join(columns)})".encode("utf-8"))
+        query = (f"SELECT {', '.join(columns)} FROM {table} "
+                 f"ORDER BY {', '.join(TABLE_KEYS[table])}")
+        for row in conn.execute(query):
+            digest.update(repr(row).encode("utf-8"))
+    return digest.hexdigest()
+
+def stored_content_hash(conn):
+    """Empreinte enregistrée par le dernier remplissage, ou None si elle a été effacée"""
+    try:
+        row = conn.execute("SELECT Value FROM Metadata WHERE Key = ?", (CONTENT_HASH_KEY,)).fetchone()
+    except sqlite3.OperationalError:
+        return None  # base antérieure à la table Metadata
+    return row[0] if row else None
+
+# --- Fichiers OurAirports (airports.csv / runways.csv) ---
+# Les lignes issues d'OurAirports sont insérées ou mises à jour à chaque import ; les aéroports
+# et pistes des fichiers du dépôt (assets/data/seed : fréquences, ILS...) ne sont jamais modifiés
+
+# Type OurAirports -> Size (0=Small, 1=Medium, 2=Large, 3=International)
+# large_airport : International s'il a des vols réguliers, Large sinon
+OURAIRPORTS_SIZES = {
+    "small_airport": 0,
+    "heliport": 0,
+    "seaplane_base": 0,
+    "medium_airport": 1,
+    "large_airport": 2,
+}
+
+# Code pays ISO -> nom utilisé par la base (les codes absents sont gardés tels quels)
+OURAIRPORTS_COUNTRIES = {
+    "AE": "Émirats arabes unis", "AR": "Argentine", "AT": "Autriche", "AU": "Australie",
+    "BE": "Belgique", "BR": "Brésil", "CA": "Canada", "CH": "Suisse", "CL": "Chili",
+    "CN": "Chine", "CO": "Colombie", "DE": "Allemagne", "DK": "Danemark", "EG": "Égypte",
+    "ES": "Espagne", "FR": "France", "GB": "Royaume-Uni", "GP": "Guadeloupe", "IN": "Inde",
+    "IT": "Italie", "JP": "Japon", "KR": "Corée du Sud", "MA": "Maroc", "MF": "Saint-Martin",
+    "MQ": "Martinique", "MX": "Mexique", "NL": "Pays-Bas", "NO": "Norvège",
+    "NZ": "Nouvelle-Zélande", "OM": "Oman", "PT": "Portugal", "QA": "Qatar",
+    "SA": "Arabie saoudite", "SE": "Suède", "SG": "Singapour", "TH": "Thaïlande",
+    "TR": "Turquie", "US": "États-Unis", "ZA": "Afrique du Sud",
+}
+
+def ourairports_size(record):
+    """Taille d'un aéroport OurAirports, ou None s'il n'est pas retenu (fermé, ballons...)"""
+    size = OURAIRPORTS_SIZES.get(record["type"])
+    if size == 2 and record.get("scheduled_service") == "yes":
+        size = 3
+    return size
+
+def ourairports_airports(records, curated=frozenset(), accepted=None):
+    """
+    Convertit les aéroports OurAirports au format de la table Airport
+    Les aéroports de curated sont ignorés ; les codes des aéroports retenus
+    (curated compris) sont ajoutés à accepted
+    """
+    for r in records:
+        size = ourairports_size(r)
+        if size is None or not r["latitude_deg"] or not r["longitude_deg"]:
+            continue
+        if accepted is not None:
+            accepted.add(r["ident"])
+        if r["ident"] in curated:
+            continue
+        yield {
+            "IcaoCode": r["ident"],
+            "IataCode": r.get("iata_code") or "",
+            "Name": r["name"],
+            "City": r.get("municipality") or "",
+            "Country": OURAIRPORTS_COUNTRIES.get(r["iso_country"], r["iso_country"]),
+            "Latitude": r["latitude_deg"],
+            "Longitude": r["longitude_deg"],
+            "Elevation": r.get("elevation_ft") or 0,
+            "Size": size,
+            "HasILS": 0,
+            "HasTower": 1 if size > 0 else 0,
+            "TowerFrequency": "",
+            "GroundFrequency": "",
+            "AtisFrequency": "",
+        }
+
+def ourairports_runways(records, accepted, curated=frozenset()):
+    """
+    Convertit les pistes OurAirports au format de la table Runway
+    Seules les pistes des aéroports de accepted sont gardées ; les aéroports de curated
+    gardent leurs pistes, dont les désignations peuvent différer
+    """
+    for r in records:
+        airport = r["airport_ident"]
+        if r.get("closed") == "1" or not r.get("length_ft"):
+            continue
+        if airport not in accepted or airport in curated:
+            continue
+        ends = [e for e in (r.get("le_ident"), r.get("he_ident")) if e]
+        if not ends:
+            continue
+        yield {
+            "AirportIcao": r["airport_ident"],
+            "Designation": "/".join(ends),
+            "Length": r["length_ft"],
+            "Width": r.get("width_ft") or 0,
+            "Surface": r.get("surface") or "",
+            "HasLights": r.get("lighted") or 0,
+            "HasILS": 0,
+        }
+
+def seed_keys(table, seed_dir=SEED_DIR):
+    """Premier élément de la clé naturelle des lignes d'une table dans les fichiers du dépôt"""
+    key = TABLE_KEYS[table][0]
+    return {record[key] for t, path in default_sources(seed_dir) if t == table
+            for record in read_records(path)}
+
+def seed_database(sources, db_path=DB_PATH, source_format="native", seed_dir=SEED_DIR):
+    """
+    Remplit la base à partir d'une liste de (table, fichier de données)
+    Tout est écrit dans une seule transaction : en cas d'erreur, rien n'est modifié
+    Au format OurAirports, les aéroports et pistes des fichiers de seed_dir sont conservés
+    Retourne le nombre de lignes traitées par table
+    """
+    converters = {}
+    counts = {}
+    with bulk_transaction(db_path) as conn:
+        if source_format == "ourairports":
+            curated_airports = seed_keys("Airport", seed_dir)
+            curated_runways = seed_keys("Runway", seed_dir)
+            if any(table == "Airport" for table, _ in sources):
+                accepted = set()
+            else:
+                # Pistes seules : aéroports déjà présents dans la base
+                accepted = {icao for (icao,) in conn.execute("SELECT IcaoCode FROM Airport")}
+            converters = {
+                "Airport": lambda records: ourairports_airports(records, curated_airports, accepted),
+                "Runway": lambda records: ourairports_runways(records, accepted, curated_runways),
+            }
+
+        for table, path in sources:
+            records = read_records(path)
+            if table in converters:
+                records = converters[table](records)
+            rows = records_to_rows(records, TABLE_COLUMNS[table])
+            counts[table] = counts.get(table, 0) + upsert_rows(conn, table, rows)
+    return counts
+
+def default_sources(seed_dir=SEED_DIR):
+    """Fichiers de données par défaut : aircraft, airports et runways (CSV ou JSON)"""
+    sources = []
+    for table, name in [("Aircraft", "aircraft"), ("Airport", "airports"), ("Runway", "runways")]:
+        for extension in (".csv", ".jsonl", ".json"):
+            path = os.path.join(seed_dir, name + extension)
+            if os.path.exists(path):
+                sources.append((table, path))
+                break
+    return sources
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Remplit la base de données du simulateur")
+    parser.add_argument("--db", default=DB_PATH, help="chemin de la base SQLite")
+    parser.add_argument("--data-dir", default=SEED_DIR,
+                        help="dossier contenant aircraft/airports/runways (.csv, .jsonl ou .json)")
+    parser.add_argument("--aircraft", help="fichier d'avions")
+    parser.add_argument("--airports", help="fichier d'aéroports")
+    parser.add_argument("--runways", help="fichier de pistes")
+    parser.add_argument("--format", choices=["native", "ourairports"], default="native",
+                        help="format des fichiers d'aéroports et de pistes")
+    args = parser.parse_args()
+
+    explicit = [(t, p) for t, p in [("Aircraft", args.aircraft), ("Airport", args.airports),
+                                    ("Runway", args.runways)] if p]
+    sources = explicit or default_sources(args.data_dir)
+
+    print("=" * 70)
+    print("  Remplissage de la base de données")
+    print("=" * 70)
+    print()
+
+    start = time.perf_counter()
+    counts = seed_database(sources, args.db, args.format, args.data_dir)
+    elapsed = time.perf_counter() - start
+
+    for table, count in counts.items():
+        print(f"  ✓ {table}: {count} lignes")
+    print(f"\n✓ Base de données à jour en {elapsed:.2f} s : {args.db}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Manifeste des sons du simulateur
+Liste déclarative de tous les fichiers audio générés par build_sounds.py
+"""
+
+# Chaque entrée décrit un fichier :
+#   output    : chemin relatif au dossier assets/
+#   generator : "module:fonction" d'un script de génération du dossier build/
+#   params    : arguments passés au générateur
+#   seed      : graine aléatoire (optionnelle, dérivée de output par défaut)
+#   stream    : rendu par blocs écrit directement sur disque, pour les sons longs
+#               (le générateur est alors une fonction stream_* qui reçoit la graine)
+#
+# Les sons joués en boucle passent loop=True à leur générateur pour un raccord exact.
+
+SOUNDS = [
+    # Sons de base (generate_sounds.py) - Cessna 172
+    {"output": "audio/cessna172_idle.wav", "generator": "generate_sounds:generate_engine_sound",
+     "params": {"base_freq": 80, "duration": 5, "rpm_variation": True}},
+    {"output": "audio/cessna172_cruise.wav", "generator": "generate_sounds:generate_engine_sound",
+     "params": {"base_freq": 120, "duration": 5, "rpm_variation": True}},
+    {"output": "audio/cessna172_full_throttle.wav", "generator": "generate_sounds:generate_engine_sound",
+     "params": {"base_freq": 150, "duration": 5, "rpm_variation": True}},
+
+    # Airbus A320
+    {"output": "audio/a320_idle.wav", "generator": "generate_sounds:generate_jet_sound",
+     "params": {"duration": 5}},
+    {"output": "audio/a320_cruise.wav", "generator": "generate_sounds:generate_jet_sound",
+     "params": {"duration": 5}},
+    {"output": "audio/a320_takeoff.wav", "generator": "generate_sounds:generate_jet_sound",
+     "params": {"duration": 5}},
+
+    # Boeing 737
+    {"output": "audio/b737_idle.wav", "generator": "generate_sounds:generate_jet_sound",
+     "params": {"duration": 5}},
+    {"output": "audio/b737_cruise.wav", "generator": "generate_sounds:generate_jet_sound",
+     "params": {"duration": 5}},
+    {"output": "audio/b737_takeoff.wav", "generator": "generate_sounds:generate_jet_sound",
+     "params": {"duration": 5}},
+
+    # Ambiance
+    {"output": "audio/cockpit_ambient.wav", "generator": "generate_sounds:stream_cockpit_ambient",
+     "params": {"duration": 60, "amplitude": 0.05, "loop": True},
+     "stream": True},
+    {"output": "audio/wind_light.wav", "generator": "generate_sounds:generate_noise",
+     "params": {"duration": 5, "amplitude": 0.1}},
+    {"output": "audio/wind_moderate.wav", "generator": "generate_sounds:generate_noise",
+     "params": {"duration": 5, "amplitude": 0.2}},
+    {"output": "audio/wind_strong.wav", "generator": "generate_sounds:generate_noise",
+     "params": {"duration": 5, "amplitude": 0.3}},
+
+    # Alertes
+    {"output": "audio/stall_warning.wav", "generator": "generate_sounds:generate_alert_sound",
+     "params": {"frequency": 800, "duration": 1, "beeps": 3}},
+    {"output": "audio/overspeed_warning.wav", "generator": "generate_sounds:generate_alert_sound",
+     "params": {"frequency": 1000, "duration": 1, "beeps": 2}},
+    {"output": "audio/altitude_warning.wav", "generator": "generate_sounds:generate_alert_sound",
+     "params": {"frequency": 600, "duration": 1, "beeps": 2}},
+    {"output": "audio/gear_warning.wav", "generator": "generate_sounds:generate_alert_sound",
+     "params": {"frequency": 500, "duration": 1, "beeps": 1}},
+    {"output": "audio/fuel_low.wav", "generator": "generate_sounds:generate_alert_sound",
+     "params": {"frequency": 700, "duration": 1, "beeps": 2}},
+
+    # Interface
+    {"output": "audio/menu_select.wav", "generator": "generate_sounds:generate_click_sound",
+     "params": {}},
+    {"output": "audio/menu_confirm.wav", "generator": "generate_sounds:generate_sine_wave",
+     "params": {"frequency": 1000, "duration": 0.1, "amplitude": 0.3}},
+    {"output": "audio/menu_cancel.wav", "generator": "generate_sounds:generate_sine_wave",
+     "params": {"frequency": 500, "duration": 0.1, "amplitude": 0.3}},
+    {"output": "audio/button_click.wav", "generator": "generate_sounds:generate_click_sound",
+     "params": {}},
+
+    # Systèmes
+    {"output": "audio/gear_down.wav", "generator": "generate_sounds:generate_sine_wave",
+     "params": {"frequency": 200, "duration": 2, "amplitude": 0.2}},
+    {"output": "audio/gear_up.wav", "generator": "generate_sounds:generate_sine_wave",
+     "params": {"frequency": 250, "duration": 2, "amplitude": 0.2}},
+    {"output": "audio/flaps_extend.wav", "generator": "generate_sounds:generate_sine_wave",
+     "params": {"frequency": 180, "duration": 1.5, "amplitude": 0.2}},
+    {"output": "audio/flaps_retract.wav", "generator": "generate_sounds:generate_sine_wave",
+     "params": {"frequency": 220, "duration": 1.5, "amplitude": 0.2}},
+
+    # Sons réalistes (generate_realistic_sounds.py) - avions légers
+    {"output": "sounds/realistic/cessna172_idle.wav", "generator": "generate_realistic_sounds:generate_propeller_sound",
+     "params": {"rpm": 2400, "num_blades": 2, "loop": True}},
+    {"output": "sounds/realistic/cessna172_cruise.wav", "generator": "generate_realistic_sounds:stream_propeller_sound",
+     "params": {"rpm": 2600, "num_blades": 2, "duration": 60, "loop": True},
+     "stream": True},
+    {"output": "sounds/realistic/cessna172_full_throttle.wav", "generator": "generate_realistic_sounds:generate_propeller_sound",
+     "params": {"rpm": 2700, "num_blades": 2, "loop": True}},
+
+    # Jets d'affaires
+    {"output": "sounds/realistic/citation_idle.wav", "generator": "generate_realistic_sounds:generate_jet_sound",
+     "params": {"thrust_level": "idle", "loop": True}},
+    {"output": "sounds/realistic/citation_cruise.wav", "generator": "generate_realistic_sounds:stream_jet_sound",
+     "params": {"thrust_level": "cruise", "duration": 60, "loop": True},
+     "stream": True},
+    {"output": "sounds/realistic/citation_full_throttle.wav", "generator": "generate_realistic_sounds:generate_jet_sound",
+     "params": {"thrust_level": "full_throttle", "loop": True}},
+
+    # Avions de ligne
+    {"output": "sounds/realistic/a320_idle.wav", "generator": "generate_realistic_sounds:generate_jet_sound",
+     "params": {"thrust_level": "idle", "loop": True}},
+    {"output": "sounds/realistic/a320_cruise.wav", "generator": "generate_realistic_sounds:stream_jet_sound",
+     "params": {"thrust_level": "cruise", "duration": 60, "loop": True},
+     "stream": True},
+    {"output": "sounds/realistic/a320_full_throttle.wav", "generator": "generate_realistic_sounds:generate_jet_sound",
+     "params": {"thrust_level": "full_throttle", "loop": True}},
+
+    # Gros porteurs
+    {"output": "sounds/realistic/a380_idle.wav", "generator": "generate_realistic_sounds:generate_jet_sound",
+     "params": {"thrust_level": "idle", "loop": True}},
+    {"output": "sounds/realistic/a380_cruise.wav", "generator": "generate_realistic_sounds:stream_jet_sound",
+     "params": {"thrust_level": "cruise", "duration": 60, "loop": True},
+     "stream": True},
+    {"output": "sounds/realistic/a380_full_throttle.wav", "generator": "generate_realistic_sounds:generate_jet_sound",
+     "params": {"thrust_level": "full_throttle", "loop": True}},
+
+    # Hélicoptères
+    {"output": "sounds/realistic/r22_rotor.wav", "generator": "generate_realistic_sounds:generate_helicopter_rotor",
+     "params": {"rpm": 350, "loop": True}},
+    {"output": "sounds/realistic/as350_rotor.wav", "generator": "generate_realistic_sounds:generate_helicopter_rotor",
+     "params": {"rpm": 400, "loop": True}},
+    {"output": "sounds/realistic/chinook_rotor.wav", "generator": "generate_realistic_sounds:generate_helicopter_rotor",
+     "params": {"rpm": 300, "loop": True}},
+
+    # Environnement
+    {"output": "sounds/realistic/wind_light.wav", "generator": "generate_realistic_sounds:stream_wind_sound",
+     "params": {"intensity": "light", "duration": 60, "loop": True},
+     "stream": True},
+    {"output": "sounds/realistic/wind_moderate.wav", "generator": "generate_realistic_sounds:stream_wind_sound",
+     "params": {"intensity": "moderate", "duration": 60, "loop": True},
+     "stream": True},
+    {"output": "sounds/realistic/wind_strong.wav", "generator": "generate_realistic_sounds:stream_wind_sound",
+     "params": {"intensity": "strong", "duration": 60, "loop": True},
+     "stream": True},
+
+    # Alertes
+    {"output": "sounds/realistic/altitude_warning.wav", "generator": "generate_realistic_sounds:generate_alert_sound",
+     "params": {"alert_type": "altitude"}},
+    {"output": "sounds/realistic/stall_warning.wav", "generator": "generate_realistic_sounds:generate_alert_sound",
+     "params": {"alert_type": "stall"}},
+    {"output": "sounds/realistic/terrain_warning.wav", "generator": "generate_realistic_sounds:generate_alert_sound",
+     "params": {"alert_type": "terrain"}},
+    {"output": "sounds/realistic/generic_warning.wav", "generator": "generate_realistic_sounds:generate_alert_sound",
+     "params": {"alert_type": "generic"}},
+
+    # Radio
+    {"output": "sounds/realistic/radio_static.wav", "generator": "generate_realistic_sounds:generate_radio_static",
+     "params": {}},
+
+    # Sons radio (generate_radio_sounds.py) - interface
+    {"output": "sounds/radio/radio_beep.wav", "generator": "generate_radio_sounds:generate_radio_beep",
+     "params": {}},
+    {"output": "sounds/radio/radio_tune.wav", "generator": "generate_radio_sounds:generate_radio_tune",
+     "params": {}},
+    {"output": "sounds/radio/radio_click.wav", "generator": "generate_radio_sounds:generate_radio_click",
+     "params": {}},
+    {"output": "sounds/radio/radio_squelch.wav", "generator": "generate_radio_sounds:generate_radio_squelch",
+     "params": {}},
+    {"output": "sounds/radio/frequency_change.wav", "generator": "generate_radio_sounds:generate_frequency_change",
+     "params": {}},
+    {"output": "sounds/radio/roger_beep.wav", "generator": "generate_radio_sounds:generate_roger_beep",
+     "params": {}},
+
+    # Ambiance radio
+    {"output": "sounds/radio/atc_background.wav", "generator": "generate_radio_sounds:generate_atc_background",
+     "params": {}},
+    {"output": "sounds/radio/radio_interference.wav", "generator": "generate_radio_sounds:generate_radio_interference",
+     "params": {}},
+
+    # Urgence
+    {"output": "sounds/radio/emergency_tone.wav", "generator": "generate_radio_sounds:generate_emergency_tone",
+     "params": {}},
+]
+
+# Déclinaisons de tous les sons pour d'autres plateformes (voir sound_variants.py),
+# écrites dans assets/variants/<name>/ pendant le rendu de chaque son :
+#   name   : nom de la déclinaison (dossier de sortie)
+#   rate   : fréquence d'échantillonnage (Hz)
+#   format : int16, float32, ima_adpcm ou flac (flac requiert le paquet soundfile)
+#
+# Le rééchantillonnage est fait une fois par fréquence : ajouter un format à une
+# fréquence déjà présente ne coûte que son encodage.
+
+VARIANTS = [
+    # Casques VR (VRSystem) : sortie 48 kHz, mixage spatial en flottant
+    {"name": "vr_48k", "rate": 48000, "format": "int16"},
+    {"name": "vr_48k_float", "rate": 48000, "format": "float32"},
+
+    # Machines modestes : empreinte mémoire et lectures réduites
+    {"name": "low_22k", "rate": 22050, "format": "int16"},
+    {"name": "low_22k_adpcm", "rate": 22050, "format": "ima_adpcm"},
+
+    # Archive sans perte à la fréquence d'origine
+    {"name": "flac", "rate": 44100, "format": "flac"},
+]
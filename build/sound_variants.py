@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Déclinaisons des sons pour d'autres plateformes (fréquence et format d'échantillon)
+Chaque son rendu est décliné en un seul passage, bloc par bloc, pendant son écriture :
+ni nouvelle synthèse, ni relecture du WAV, et la mémoire reste bornée par la taille de bloc
+
+Un rééchantillonneur polyphase par fréquence cible, partagé par tous les formats de
+cette fréquence, alimente les écrivains :
+  int16     : WAV PCM 16 bits
+  float32   : WAV flottant 32 bits (WAVE_FORMAT_IEEE_FLOAT)
+  ima_adpcm : WAV IMA ADPCM 4 bits (WAVE_FORMAT_IMA_ADPCM), blocs indépendants
+  flac      : FLAC 16 bits (paquet soundfile, facultatif)
+"""
+
+import math
+import os
+import struct
+
+import numpy as np
+from scipy import signal
+
+import dsp
+
+try:
+    import soundfile
+except ImportError:  # FLAC facultatif
+    soundfile = None
+
+# Nombre de blocs ADPCM encodés ensemble (encodage vectorisé sur les blocs) :
+# environ un million d'échantillons en attente au plus
+ADPCM_BATCH = 1024
+
+# Tables de l'IMA ADPCM
+ADPCM_STEPS = np.array([
+    7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 19, 21, 23, 25, 28, 31, 34, 37, 41, 45,
+    50, 55, 60, 66, 73, 80, 88, 97, 107, 118, 130, 143, 157, 173, 190, 209, 230,
+    253, 279, 307, 337, 371, 408, 449, 494, 544, 598, 658, 724, 796, 876, 963,
+    1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066, 2272, 2499, 2749, 3024, 3327,
+    3660, 4026, 4428, 4871, 5358, 5894, 6484, 7132, 7845, 8630, 9493, 10442, 11487,
+    12635, 13899, 15289, 16818, 18500, 20350, 22385, 24623, 27086, 29794, 32767,
+], dtype=np.int32)
+ADPCM_INDEX_SHIFT = np.array([-1, -1, -1, -1, 2, 4, 6, 8], dtype=np.int32)
+
+# Écart reconstruit par le décodeur pour chaque (indice de pas, amplitude 0-7)
+ADPCM_DELTAS = ((ADPCM_STEPS[:, None] >> 3)
+                + np.where(np.arange(8) & 4, ADPCM_STEPS[:, None], 0)
+                + np.where(np.arange(8) & 2, ADPCM_STEPS[:, None] >> 1, 0)
+                + np.where(np.arange(8) & 1, ADPCM_STEPS[:, None] >> 2, 0)).ravel()
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_IMA_ADPCM = 0x0011
+
+# --- Rééchantillonnage ---
+
+class Resampler:
+    """
+    Rééchantillonnage polyphase en flux, identique à scipy.signal.resample_poly
+    (même filtre RIF à fenêtre de Kaiser, mêmes bords nuls) sur un son rendu par blocs
+
+    Une boucle est rééchantillonnée circulairement : son début, conservé, prolonge
+    sa fin. La sortie commence alors quelques échantillons plus loin (moins d'une
+    milliseconde) pour ne dépendre que d'échantillons déjà reçus ; ces échantillons
+    terminent la sortie, qui reste une boucle exacte de même durée.
+    """
+
+    def __init__(self, rate_in, rate_out, loop=False):
+        g = math.gcd(rate_in, rate_out)
+        self.up, self.down = rate_out // g, rate_in // g
+        self.loop = loop
+        if self.up == self.down:
+            return  # même fréquence : les blocs sont transmis tels quels
+        max_rate = max(self.up, self.down)
+        self.half_len = 10 * max_rate
+        taps = signal.firwin(2 * self.half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0)) * self.up
+
+        # Décalage du filtre pour que la sortie m corresponde à l'entrée m * down / up
+        pre = self.down - self.half_len % self.down
+        self.taps = np.concatenate([np.zeros(pre), taps])
+        self.delay = (self.half_len + pre) // self.down
+
+        self.buffer = np.zeros(0)
+        self.start = 0        # position du premier échantillon de buffer (multiple de down)
+        self.received = 0
+        self.skip = -(-self.half_len // self.down) if loop else 0
+        self.emitted = self.skip
+        self.head = np.zeros(0)
+        self.head_len = ((self.skip - 1) * self.down + self.half_len) // self.up + 1
+
+    def process(self, block):
+        """Rééchantillonne un bloc : retourne les sorties dont toutes les entrées sont reçues"""
+        if self.up == self.down:
+            return block
+        block = np.asarray(block, dtype=np.float64)
+        if self.loop and len(self.head) < self.head_len:
+            self.head = np.concatenate([self.head, block[:self.head_len - len(self.head)]])
+        self.buffer = np.concatenate([self.buffer, block])
+        self.received += len(block)
+        return self._emit(-(-(self.received * self.up - self.half_len) // self.down))
+
+    def flush(self):
+        """Termine le son : bords nuls, ou début de la boucle après sa fin"""
+        if self.up == self.down:
+            return np.zeros(0)
+        total = -(-self.received * self.up // self.down)
+        stop = total + self.skip
+        pad = ((stop - 1) * self.down + self.half_len) // self.up + 1 - self.received
+        if self.loop:
+            tail = np.resize(self.head, max(pad, 0))
+        else:
+            tail = np.zeros(max(pad, 0))
+        self.buffer = np.concatenate([self.buffer, tail])
+        return self._emit(stop)
+
+    def _emit(self, stop):
+        """Calcule les sorties [emitted, stop) et oublie les entrées devenues inutiles"""
+        if stop <= self.emitted:
+            return np.zeros(0)
+        y = signal.upfirdn(self.taps, self.buffer, self.up, self.down)
+        shift = self.delay - self.start * self.up // self.down
+        out = y[self.emitted + shift:stop + shift]
+        self.emitted = stop
+
+        first = max(0, (stop * self.down - self.half_len) // self.up)
+        first -= first % self.down
+        if first > self.start:
+            self.buffer = self.buffer[first - self.start:]
+            self.start = first
+        return out
+
+# --- Écrivains ---
+
+def wav_header(format_tag, rate, byte_rate, block_align, bits, data_size, frames=None, extra=b""):
+    """En-tête WAV mono ; chunk fact (nombre de trames) pour les formats non PCM"""
+    fmt = struct.pack("<HHIIHH", format_tag, 1, rate, byte_rate, block_align, bits) + extra
+    chunks = b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    if frames is not None:
+        chunks += b"fact" + struct.pack("<II", 4, frames)
+    chunks += b"data" + struct.pack("<I", data_size)
+    return b"RIFF" + struct.pack("<I", 4 + len(chunks) + data_size) + b"WAVE" + chunks
+
+def to_pcm16(y):
+    """Convertit en PCM 16 bits, en écrêtant le léger dépassement dû au filtrage"""
+    return dsp.to_int16(np.clip(y, -1.0, 1.0)).astype("<i2")
+
+class WavWriter:
+    """WAV PCM 16 bits ou flottant 32 bits écrit en flux (en-tête complété à la fermeture)"""
+
+    def __init__(self, path, rate, sample_format):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.rate = rate
+        self.float = sample_format == "float32"
+        self.frames = 0
+        self.file = open(self.tmp_path, "wb")
+        self.file.write(self.header())
+
+    def header(self):
+        if self.float:
+            return wav_header(WAVE_FORMAT_IEEE_FLOAT, self.rate, self.rate * 4, 4, 32,
+                              self.frames * 4, self.frames, struct.pack("<H", 0))
+        return wav_header(WAVE_FORMAT_PCM, self.rate, self.rate * 2, 2, 16, self.frames * 2)
+
+    def write(self, y):
+        data = y.astype("<f4") if self.float else to_pcm16(y)
+        self.file.write(data.tobytes())
+        self.frames += len(data)
+
+    def close(self):
+        self.file.seek(0)
+        self.file.write(self.header())
+        self.file.close()
+        os.replace(self.tmp_path, self.path)
+        return self.frames
+
+def adpcm_block_align(rate):
+    """Taille des blocs IMA ADPCM usuelle pour une fréquence"""
+    return 256 * max(1, min(4, -(-rate // 11025)))
+
+def encode_adpcm_blocks(samples, block_samples):
+    """
+    Encode des blocs IMA ADPCM mono indépendants, tous à la fois
+    samples : int16, (nombre de blocs, block_samples) ; retourne les octets des blocs
+    L'indice de pas de départ de chaque bloc est estimé sur ses premiers échantillons
+    """
+    columns = np.ascontiguousarray(samples.T, dtype=np.int32)
+    predictor = columns[0].copy()
+    first_step = np.abs(columns[1] - columns[0])
+    index = np.minimum(np.searchsorted(ADPCM_STEPS, first_step), 88).astype(np.int32)
+    header_index = index.copy()
+
+    # Boucle sur la position dans le bloc, vectorisée sur les blocs
+    nibbles = np.empty((block_samples - 1, len(samples)), dtype=np.uint8)
+    for i in range(1, block_samples):
+        diff = columns[i] - predictor
+        negative = diff < 0
+        magnitude = np.minimum(np.abs(diff) * 4 // ADPCM_STEPS[index], 7)
+        delta = ADPCM_DELTAS[index * 8 + magnitude]
+        predictor = np.where(negative, predictor - delta, predictor + delta)
+        np.minimum(np.maximum(predictor, -32768, out=predictor), 32767, out=predictor)
+        index = index + ADPCM_INDEX_SHIFT[magnitude]
+        np.minimum(np.maximum(index, 0, out=index), 88, out=index)
+        nibbles[i - 1] = magnitude | (negative << 3)
+    nibbles = nibbles.T
+
+    headers = np.zeros((len(samples), 4), dtype=np.uint8)
+    headers[:, :2] = samples[:, :1].astype("<i2").view(np.uint8)
+    headers[:, 2] = header_index
+    packed = nibbles[:, 0::2] | (nibbles[:, 1::2] << 4)
+    return np.concatenate([headers, packed], axis=1).tobytes()
+
+class AdpcmWriter:
+    """
+    WAV IMA ADPCM écrit en flux : les échantillons sont encodés par lots de blocs
+    Le dernier bloc est complété par des zéros ; le chunk fact donne la longueur exacte
+    """
+
+    def __init__(self, path, rate):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.rate = rate
+        self.block_align = adpcm_block_align(rate)
+        self.block_samples = (self.block_align - 4) * 2 + 1
+        self.pending = []
+        self.pending_len = 0
+        self.frames = 0
+        self.blocks = 0
+        self.file = open(self.tmp_path, "wb")
+        self.file.write(self.header())
+
+    def header(self):
+        byte_rate = self.rate * self.block_align // self.block_samples
+        return wav_header(WAVE_FORMAT_IMA_ADPCM, self.rate, byte_rate, self.block_align, 4,
+                          self.blocks * self.block_align, self.frames,
+                          struct.pack("<HH", 2, self.block_samples))
+
+    def write(self, y):
+        self.pending.append(to_pcm16(y))
+        self.pending_len += len(y)
+        self.frames += len(y)
+        if self.pending_len >= ADPCM_BATCH * self.block_samples:
+            self._encode(final=False)
+
+    def _encode(self, final):
+        samples = np.concatenate(self.pending) if self.pending else np.zeros(0, dtype="<i2")
+        count = len(samples) // self.block_samples
+        if final and len(samples) % self.block_samples:
+            count += 1
+            samples = np.concatenate([samples, np.zeros(count * self.block_samples - len(samples),
+                                                        dtype=samples.dtype)])
+        used = count * self.block_samples
+        if count:
+            self.file.write(encode_adpcm_blocks(samples[:used].reshape(count, self.block_samples),
+                                                self.block_samples))
+            self.blocks += count
+        self.pending = [samples[used:]]
+        self.pending_len = len(samples) - used
+
+    def close(self):
+        self._encode(final=True)
+        self.file.seek(0)
+        self.file.write(self.header())
+        self.file.close()
+        os.replace(self.tmp_path, self.path)
+        return self.frames
+
+class FlacWriter:
+    """FLAC 16 bits écrit en flux (paquet soundfile)"""
+
+    def __init__(self, path, rate):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.frames = 0
+        self.file = soundfile.SoundFile(self.tmp_path, "w", samplerate=rate, channels=1,
+                                        format="FLAC", subtype="PCM_16")
+
+    def write(self, y):
+        self.file.write(to_pcm16(y))
+        self.frames += len(y)
+
+    def close(self):
+        self.file.close()
+        os.replace(self.tmp_path, self.path)
+        return self.frames
+
+def open_writer(path, variant):
+    """Ouvre l'écrivain d'une déclinaison"""
+    sample_format = variant["format"]
+    if sample_format in ("int16", "float32"):
+        return WavWriter(path, variant["rate"], sample_format)
+    if sample_format == "ima_adpcm":
+        return AdpcmWriter(path, variant["rate"])
+    if sample_format == "flac":
+        if soundfile is None:
+            raise RuntimeError("Le format flac requiert le paquet soundfile (pip install soundfile)")
+        return FlacWriter(path, variant["rate"])
+    raise ValueError(f"Format de déclinaison inconnu : {sample_format}")
+
+# --- Déclinaison d'un son ---
+
+class FanOut:
+    """
+    Décline un son, bloc par bloc, dans toutes ses variantes en un seul passage
+    Le rééchantillonnage est fait une fois par fréquence, quel que soit le nombre de formats
+    """
+
+    def __init__(self, targets, loop=False, rate=dsp.SAMPLE_RATE):
+        """targets : liste de (chemin du fichier, déclinaison)"""
+        self.resamplers = {}
+        self.writers = []
+        for path, variant in targets:
+            if variant["rate"] not in self.resamplers:
+                self.resamplers[variant["rate"]] = Resampler(rate, variant["rate"], loop)
+            self.writers.append((variant["rate"], open_writer(path, variant)))
+
+    def _write(self, resampled):
+        for rate, writer in self.writers:
+            if len(resampled[rate]):
+                writer.write(resampled[rate])
+
+    def write(self, block):
+        """Ajoute un bloc du son à toutes les déclinaisons"""
+        self._write({rate: r.process(block) for rate, r in self.resamplers.items()})
+
+    def tee(self, blocks):
+        """Transmet les blocs d'un rendu en flux en les déclinant au passage"""
+        for block in blocks:
+            self.write(block)
+            yield block
+
+    def close(self):
+        """Termine toutes les déclinaisons ; retourne leurs nombres de trames (ordre de targets)"""
+        self._write({rate: r.flush() for rate, r in self.resamplers.items()})
+        return [writer.close() for _, writer in self.writers]
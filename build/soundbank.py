@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Banque de sons du simulateur
+Regroupe tous les sons générés dans un fichier unique indexé, projetable en mémoire (mmap)
+
+Format (petit-boutiste) :
+  En-tête (64 octets) : magic "SVFRBANK", version, nombre d'entrées,
+                        position et taille de l'index, alignement des données
+  Index (128 octets par son) : nom, position, nombre de trames, fréquence,
+                               canaux, format d'échantillon, début et fin de boucle
+  Données : échantillons PCM int16 bruts de chaque son, alignés sur ALIGNMENT octets
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import wave
+
+import numpy as np
+
+MAGIC = b"SVFRBANK"
+VERSION = 1
+
+# Alignement des données de chaque son (une page mémoire)
+ALIGNMENT = 4096
+
+# Formats d'échantillon
+FORMAT_PCM16 = 1
+
+HEADER = struct.Struct("<8sIIQQI28x")
+ENTRY = struct.Struct("<64sQQIHHQQ24x")
+NAME_SIZE = 64
+
+# Même disposition que ENTRY, pour lire l'index sans copie
+ENTRY_DTYPE = np.dtype({
+    "names": ["name", "offset", "frames", "rate", "channels", "format", "loop_start", "loop_end"],
+    "formats": ["S64", "<u8", "<u8", "<u4", "<u2", "<u2", "<u8", "<u8"],
+    "offsets": [0, 64, 72, 80, 84, 86, 88, 96],
+    "itemsize": ENTRY.size,
+})
+
+def sound_name(output):
+    """Nom d'un son dans la banque : son chemin relatif sans extension"""
+    return os.path.splitext(output)[0].replace(os.sep, "/")
+
+def align(position):
+    """Arrondit une position au multiple supérieur de ALIGNMENT"""
+    return (position + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def read_wav_frames(path):
+    """Lit un WAV PCM 16 bits : (octets bruts, trames, fréquence, canaux)"""
+    with wave.open(path, "rb") as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"{path} : seul le PCM 16 bits est pris en charge")
+        frames = wav.getnframes()
+        return wav.readframes(frames), frames, wav.getframerate(), wav.getnchannels()
+
+def write_bank(bank_path, sounds, assets_dir):
+    """
+    Écrit la banque à partir d'une liste de sons (écriture atomique)
+    sounds : liste de (chemin relatif du WAV, son joué en boucle)
+    """
+    index_offset = HEADER.size
+    data_offset = align(index_offset + ENTRY.size * len(sounds))
+
+    tmp_path = bank_path + ".tmp"
+    with open(tmp_path, "wb") as bank:
+        bank.write(HEADER.pack(MAGIC, VERSION, len(sounds), index_offset,
+                               ENTRY.size * len(sounds), ALIGNMENT))
+
+        position = data_offset
+        for i, (output, loop) in enumerate(sounds):
+            name = sound_name(output).encode("utf-8")
+            if len(name) > NAME_SIZE:
+                raise ValueError(f"Nom de son trop long pour la banque : {output}")
+
+            data, frames, rate, channels = read_wav_frames(os.path.join(assets_dir, output))
+            loop_end = frames if loop else 0
+
+            bank.seek(index_offset + i * ENTRY.size)
+            bank.write(ENTRY.pack(name, position, frames, rate, channels, FORMAT_PCM16, 0, loop_end))
+            bank.seek(position)
+            bank.write(data)
+            position = align(position + len(data))
+
+        bank.truncate(position)
+
+    os.replace(tmp_path, bank_path)
+
+class SoundBank:
+    """
+    Lecture d'une banque de sons projetée en mémoire
+    Les échantillons sont des vues numpy sur le fichier : aucun son n'est copié
+    ni lu sur disque avant d'être utilisé. Une vue reste valide tant qu'elle existe :
+    si des vues sont encore utilisées à la fermeture, la projection n'est libérée
+    qu'avec la dernière d'entre elles
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, index_offset, index_size, _ = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} n'est pas une banque de sons")
+        if version != VERSION:
+            raise ValueError(f"Version de banque non prise en charge : {version}")
+
+        self._index = np.frombuffer(self._mmap, dtype=ENTRY_DTYPE, count=count, offset=index_offset)
+        self._positions = {entry.decode("utf-8"): i for i, entry in enumerate(self._index["name"])}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __contains__(self, name):
+        return name in self._positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def close(self):
+        """
+        Libère la projection du fichier
+        Si des vues de samples() existent encore, elle reste ouverte jusqu'à leur libération
+        """
+        if self._mmap is None:
+            return
+        self._index = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # vues encore utilisées : le ramasse-miettes libérera la projection
+        self._mmap = None
+
+    def names(self):
+        """Noms des sons dans l'ordre de la banque"""
+        return list(self._positions)
+
+    def info(self, name):
+        """Métadonnées d'un son"""
+        entry = self._index[self._positions[name]]
+        return {
+            "offset": int(entry["offset"]),
+            "frames": int(entry["frames"]),
+            "rate": int(entry["rate"]),
+            "channels": int(entry["channels"]),
+            "loop_start": int(entry["loop_start"]),
+            "loop_end": int(entry["loop_end"]),
+        }
+
+    def samples(self, name):
+        """Échantillons int16 d'un son (vue sans copie, entrelacés si stéréo)"""
+        entry = self._index[self._positions[name]]
+        count = int(entry["frames"]) * int(entry["channels"])
+        return np.frombuffer(self._mmap, dtype="<i2", count=count, offset=int(entry["offset"]))
+
+def verify_bank(bank_path, sounds, assets_dir):
+    """
+    Vérifie que chaque son de la banque est identique au bit près à son WAV
+    Retourne la liste des erreurs
+    """
+    errors = []
+    kept = []
+    with SoundBank(bank_path) as bank:
+        expected = {sound_name(output): (output, loop) for output, loop in sounds}
+
+        for name in bank.names():
+            if name not in expected:
+                errors.append(f"{name} : absent du manifeste")
+
+        for name, (output, loop) in expected.items():
+            if name not in bank:
+                errors.append(f"{name} : absent de la banque")
+                continue
+
+            data, frames, rate, channels = read_wav_frames(os.path.join(assets_dir, output))
+            info = bank.info(name)
+            if (info["frames"], info["rate"], info["channels"]) != (frames, rate, channels):
+                errors.append(f"{name} : format différent du WAV")
+            elif bank.samples(name).tobytes() != data:
+                errors.append(f"{name} : échantillons différents du WAV")
+            elif info["loop_end"] != (frames if loop else 0):
+                errors.append(f"{name} : points de boucle incorrects")
+            kept.append((name, bank.samples(name), data))
+
+    # Les vues restent valides après la fermeture de la banque
+    for name, view, data in kept:
+        if view.tobytes() != data:
+            errors.append(f"{name} : échantillons illisibles après fermeture de la banque")
+    return errors
+
+def main():
+    """Point d'entrée en ligne de commande"""
+    import build_sounds
+
+    parser = argparse.ArgumentParser(description="Construit ou vérifie la banque de sons")
+    parser.add_argument("--verify", action="store_true",
+                        help="vérifie la banque existante au lieu de la reconstruire")
+    parser.add_argument("--bank", default=build_sounds.BANK_FILE,
+                        help="chemin de la banque de sons")
+    args = parser.parse_args()
+
+    sounds = build_sounds.bank_sounds()
+
+    if args.verify:
+        errors = verify_bank(args.bank, sounds, build_sounds.ASSETS_DIR)
+        for error in errors:
+            print(f"  ✗ {error}")
+        if errors:
+            raise SystemExit(1)
+        print(f"✓ {len(sounds)} sons identiques au bit près dans {args.bank}")
+    else:
+        write_bank(args.bank, sounds, build_sounds.ASSETS_DIR)
+        print(f"✓ Banque de {len(sounds)} sons écrite : {args.bank}")
+
+if __name__ == "__main__":
+    main()
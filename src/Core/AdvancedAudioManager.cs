@@ -44,7 +44,7 @@ namespace SimulateurVolFR.Core
         }
 
         /// <summary>
-        /// Charge un son dans le cache
+        /// Charge un son dans le cache, depuis la banque de sons si elle le contient, sinon depuis son fichier
         /// </summary>
         public void LoadSound(string name, string filePath)
         {
@@ -52,7 +52,10 @@ namespace SimulateurVolFR.Core
             {
                 try
                 {
-                    soundCache[name] = new CachedSound(filePath);
+                    if (SoundBank.TryLoadFile(filePath, out var samples, out var waveFormat))
+                        soundCache[name] = new CachedSound(samples, waveFormat);
+                    else
+                        soundCache[name] = new CachedSound(filePath);
                 }
                 catch (Exception ex)
                 {
@@ -273,6 +276,12 @@ namespace SimulateurVolFR.Core
                 AudioData = wholeFile.ToArray();
             }
         }
+
+        public CachedSound(float[] audioData, WaveFormat waveFormat)
+        {
+            AudioData = audioData;
+            WaveFormat = waveFormat;
+        }
     }
 
     /// <summary>
@@ -48,6 +48,7 @@ namespace SimulateurVolFR.Core
                 outputDevice = null;
                 mixer = null;
                 soundCache.Clear();
+                SoundBank.CloseDefault();
                 isInitialized = false;
             }
             catch (Exception ex)
@@ -57,15 +58,20 @@ namespace SimulateurVolFR.Core
         }
 
         /// <summary>
-        /// Charge un son en mémoire
+        /// Charge un son en mémoire, depuis la banque de sons si elle le contient, sinon depuis son fichier
         /// </summary>
         public static void LoadSound(string name, string filePath)
         {
-            if (!File.Exists(filePath)) return;
-
             try
             {
-                soundCache[name] = new CachedSound(filePath);
+                if (SoundBank.TryLoadFile(filePath, out var samples, out var waveFormat))
+                {
+                    soundCache[name] = new CachedSound(samples, waveFormat);
+                }
+                else if (File.Exists(filePath))
+                {
+                    soundCache[name] = new CachedSound(filePath);
+                }
             }
             catch (Exception ex)
             {
@@ -144,6 +150,12 @@ namespace SimulateurVolFR.Core
             }
             AudioData = wholeFile.ToArray();
         }
+
+        public CachedSound(float[] audioData, WaveFormat waveFormat)
+        {
+            AudioData = audioData;
+            WaveFormat = waveFormat;
+        }
     }
 
     /// <summary>
@@ -0,0 +1,202 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.IO.MemoryMappedFiles;
+using System.Text;
+using NAudio.Wave;
+
+namespace SimulateurVolFR.Core
+{
+    /// <summary>
+    /// Banque de sons projetée en mémoire (assets/sounds.bank, produite par build/soundbank.py)
+    /// Un seul fichier ouvert au démarrage au lieu d'un WAV par son ; le format est décrit
+    /// en tête de build/soundbank.py
+    /// </summary>
+    public sealed class SoundBank : IDisposable
+    {
+        private const string Magic = "SVFRBANK";
+        private const uint Version = 1;
+        private const int HeaderSize = 64;
+        private const int EntrySize = 128;
+        private const int NameSize = 64;
+        private const ushort FormatPcm16 = 1;
+
+        private static readonly object defaultLock = new object();
+        private static SoundBank? defaultBank;
+        private static bool defaultOpened;
+
+        private readonly MemoryMappedFile file;
+        private readonly MemoryMappedViewAccessor view;
+        private readonly Dictionary<string, SoundBankEntry> entries = new Dictionary<string, SoundBankEntry>();
+
+        /// <summary>
+        /// Dossier des sons : les noms de la banque sont les chemins relatifs à ce dossier, sans extension
+        /// </summary>
+        public static string AssetsDirectory { get; } = Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "assets");
+
+        /// <summary>
+        /// Banque par défaut (assets/sounds.bank), ouverte au premier appel ; null si elle est absente ou illisible
+        /// </summary>
+        public static SoundBank? Default
+        {
+            get
+            {
+                lock (defaultLock)
+                {
+                    if (!defaultOpened)
+                    {
+                        defaultOpened = true;
+                        defaultBank = TryOpen(Path.Combine(AssetsDirectory, "sounds.bank"));
+                    }
+                    return defaultBank;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Ferme la banque par défaut (arrêt de l'audio)
+        /// </summary>
+        public static void CloseDefault()
+        {
+            lock (defaultLock)
+            {
+                defaultBank?.Dispose();
+                defaultBank = null;
+                defaultOpened = false;
+            }
+        }
+
+        /// <summary>
+        /// Ouvre une banque, ou retourne null si elle est absente ou invalide
+        /// </summary>
+        public static SoundBank? TryOpen(string path)
+        {
+            if (!File.Exists(path)) return null;
+
+            try
+            {
+                return new SoundBank(path);
+            }
+            catch (Exception ex)
+            {
+                Console.WriteLine($"Banque de sons ignorée ({path}): {ex.Message}");
+                return null;
+            }
+        }
+
+        public SoundBank(string path)
+        {
+            file = MemoryMappedFile.CreateFromFile(path, FileMode.Open, null, 0, MemoryMappedFileAccess.Read);
+            try
+            {
+                view = file.CreateViewAccessor(0, 0, MemoryMappedFileAccess.Read);
+                ReadIndex();
+            }
+            catch
+            {
+                view?.Dispose();
+                file.Dispose();
+                throw;
+            }
+        }
+
+        private void ReadIndex()
+        {
+            var magic = new byte[Magic.Length];
+            view.ReadArray(0, magic, 0, magic.Length);
+            if (Encoding.ASCII.GetString(magic) != Magic)
+                throw new InvalidDataException("ce fichier n'est pas une banque de sons");
+
+            uint version = view.ReadUInt32(8);
+            if (version != Version)
+                throw new InvalidDataException($"version de banque non prise en charge : {version}");
+
+            uint count = view.ReadUInt32(12);
+            long indexOffset = (long)view.ReadUInt64(16);
+            if (indexOffset < HeaderSize || indexOffset + (long)count * EntrySize > view.Capacity)
+                throw new InvalidDataException("index de la banque hors du fichier");
+            var name = new byte[NameSize];
+
+            for (long i = 0; i < count; i++)
+            {
+                long position = indexOffset + i * EntrySize;
+                view.ReadArray(position, name, 0, NameSize);
+                int length = Array.IndexOf(name, (byte)0);
+                var entry = new SoundBankEntry(
+                    Encoding.UTF8.GetString(name, 0, length < 0 ? NameSize : length),
+                    (long)view.ReadUInt64(position + 64),
+                    (long)view.ReadUInt64(position + 72),
+                    (int)view.ReadUInt32(position + 80),
+                    view.ReadUInt16(position + 84),
+                    view.ReadUInt16(position + 86),
+                    (long)view.ReadUInt64(position + 88),
+                    (long)view.ReadUInt64(position + 96));
+                entries[entry.Name] = entry;
+            }
+        }
+
+        /// <summary>
+        /// Nom dans la banque d'un fichier son de assets/ (chemin relatif sans extension), ou null
+        /// </summary>
+        public static string? NameForFile(string filePath)
+        {
+            string relative = Path.GetRelativePath(AssetsDirectory, Path.GetFullPath(filePath));
+            if (relative.StartsWith("..") || Path.IsPathRooted(relative)) return null;
+
+            string withoutExtension = Path.ChangeExtension(relative, null);
+            return withoutExtension.Replace(Path.DirectorySeparatorChar, '/');
+        }
+
+        /// <summary>
+        /// Échantillons d'un fichier son lus dans la banque par défaut, si elle le contient
+        /// </summary>
+        public static bool TryLoadFile(string filePath, out float[] samples, out WaveFormat waveFormat)
+        {
+            samples = Array.Empty<float>();
+            waveFormat = null!;
+            var bank = Default;
+            string? name = NameForFile(filePath);
+            return bank != null && name != null && bank.TryReadSamples(name, out samples, out waveFormat);
+        }
+
+        public int Count => entries.Count;
+
+        public bool Contains(string name) => entries.ContainsKey(name);
+
+        public bool TryGetEntry(string name, out SoundBankEntry entry) => entries.TryGetValue(name, out entry!);
+
+        /// <summary>
+        /// Échantillons d'un son en flottants [-1, 1[ (comme AudioFileReader pour un WAV 16 bits)
+        /// </summary>
+        public bool TryReadSamples(string name, out float[] samples, out WaveFormat waveFormat)
+        {
+            samples = Array.Empty<float>();
+            waveFormat = null!;
+            if (!entries.TryGetValue(name, out var entry) || entry.Format != FormatPcm16) return false;
+
+            int count = checked((int)(entry.Frames * entry.Channels));
+            var pcm = new short[count];
+            view.ReadArray(entry.Offset, pcm, 0, count);
+
+            samples = new float[count];
+            for (int i = 0; i < count; i++)
+            {
+                samples[i] = pcm[i] / 32768f;
+            }
+            waveFormat = WaveFormat.CreateIeeeFloatWaveFormat(entry.Rate, entry.Channels);
+            return true;
+        }
+
+        public void Dispose()
+        {
+            view.Dispose();
+            file.Dispose();
+        }
+    }
+
+    /// <summary>
+    /// Entrée de l'index de la banque de sons
+    /// </summary>
+    public readonly record struct SoundBankEntry(
+        string Name, long Offset, long Frames, int Rate, int Channels, int Format, long LoopStart, long LoopEnd);
+}
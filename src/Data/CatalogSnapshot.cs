@@ -0,0 +1,163 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using Newtonsoft.Json.Linq;
+using SimulateurVolFR.Models;
+
+namespace SimulateurVolFR.Data
+{
+    /// <summary>
+    /// Catalogue précompilé des avions, aéroports et pistes (assets/data/catalog.json,
+    /// produit par build/catalog.py) : une seule lecture de fichier au démarrage
+    /// au lieu d'une requête par aéroport
+    /// </summary>
+    public class CatalogSnapshot
+    {
+        public const int Format = 1;
+
+        public string Version { get; }
+
+        private readonly JObject aircraft;
+        private readonly JObject airports;
+        private readonly JObject runways;
+
+        private CatalogSnapshot(JObject data)
+        {
+            Version = data.Value<string>("version") ?? "";
+            aircraft = (JObject)data["aircraft"]!["columns"]!;
+            airports = (JObject)data["airports"]!["columns"]!;
+            runways = (JObject)data["runways"]!["columns"]!;
+        }
+
+        /// <summary>
+        /// Charge le catalogue s'il correspond à la version attendue du contenu de la base
+        /// Retourne null s'il est absent, illisible ou périmé
+        /// </summary>
+        public static CatalogSnapshot? TryLoad(string path, string? expectedVersion)
+        {
+            if (expectedVersion == null || !File.Exists(path))
+            {
+                return null;
+            }
+
+            try
+            {
+                var data = JObject.Parse(File.ReadAllText(path));
+                if (data.Value<int>("format") != Format || data.Value<string>("version") != expectedVersion)
+                {
+                    return null;
+                }
+                return new CatalogSnapshot(data);
+            }
+            catch (Exception)
+            {
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Avions, triés par constructeur et nom
+        /// </summary>
+        public List<Aircraft> GetAircraft()
+        {
+            var result = new List<Aircraft>();
+            int count = ((JArray)aircraft["Id"]!).Count;
+
+            for (int i = 0; i < count; i++)
+            {
+                result.Add(new Aircraft
+                {
+                    Id = Text(aircraft, "Id", i),
+                    Name = Text(aircraft, "Name", i),
+                    Manufacturer = Text(aircraft, "Manufacturer", i),
+                    Type = (AircraftType)Integer(aircraft, "Type", i),
+                    MaxSpeed = Real(aircraft, "MaxSpeed", i),
+                    CruiseSpeed = Real(aircraft, "CruiseSpeed", i),
+                    MaxAltitude = Real(aircraft, "MaxAltitude", i),
+                    Range = Real(aircraft, "Range", i),
+                    FuelCapacity = Real(aircraft, "FuelCapacity", i),
+                    FuelConsumption = Real(aircraft, "FuelConsumption", i),
+                    PassengerCapacity = Integer(aircraft, "PassengerCapacity", i),
+                    EmptyWeight = Real(aircraft, "EmptyWeight", i),
+                    MaxTakeoffWeight = Real(aircraft, "MaxTakeoffWeight", i),
+                    TakeoffSpeed = Real(aircraft, "TakeoffSpeed", i),
+                    LandingSpeed = Real(aircraft, "LandingSpeed", i),
+                    ClimbRate = Real(aircraft, "ClimbRate", i),
+                    DescentRate = Real(aircraft, "DescentRate", i),
+                    TurnRate = Real(aircraft, "TurnRate", i),
+                    EngineCount = Integer(aircraft, "EngineCount", i),
+                    EngineType = Text(aircraft, "EngineType", i),
+                    EngineSound = Text(aircraft, "EngineSound", i),
+                    CabinSound = Text(aircraft, "CabinSound", i)
+                });
+            }
+
+            return result;
+        }
+
+        /// <summary>
+        /// Aéroports avec leurs pistes, triés par pays, ville et nom
+        /// </summary>
+        public List<Airport> GetAirports()
+        {
+            var result = new List<Airport>();
+            int count = ((JArray)airports["IcaoCode"]!).Count;
+
+            for (int i = 0; i < count; i++)
+            {
+                var airport = new Airport
+                {
+                    IcaoCode = Text(airports, "IcaoCode", i),
+                    IataCode = Text(airports, "IataCode", i),
+                    Name = Text(airports, "Name", i),
+                    City = Text(airports, "City", i),
+                    Country = Text(airports, "Country", i),
+                    Latitude = Real(airports, "Latitude", i),
+                    Longitude = Real(airports, "Longitude", i),
+                    Elevation = Real(airports, "Elevation", i),
+                    Size = (AirportSize)Integer(airports, "Size", i),
+                    HasILS = Integer(airports, "HasILS", i) == 1,
+                    HasTower = Integer(airports, "HasTower", i) == 1,
+                    TowerFrequency = Text(airports, "TowerFrequency", i),
+                    GroundFrequency = Text(airports, "GroundFrequency", i),
+                    AtisFrequency = Text(airports, "AtisFrequency", i)
+                };
+
+                // Pistes de l'aéroport : plage contiguë de la table des pistes
+                int start = Integer(airports, "RunwayStart", i);
+                int runwayCount = Integer(airports, "RunwayCount", i);
+                for (int r = start; r < start + runwayCount; r++)
+                {
+                    airport.Runways.Add(new Runway
+                    {
+                        Designation = Text(runways, "Designation", r),
+                        Length = Integer(runways, "Length", r),
+                        Width = Integer(runways, "Width", r),
+                        Surface = Text(runways, "Surface", r),
+                        HasLights = Integer(runways, "HasLights", r) == 1,
+                        HasILS = Integer(runways, "HasILS", r) == 1
+                    });
+                }
+
+                result.Add(airport);
+            }
+
+            return result;
+        }
+
+        private static string Text(JObject columns, string column, int i)
+        {
+            return columns[column]![i]!.Value<string>() ?? "";
+        }
+
+        private static int Integer(JObject columns, string column, int i)
+        {
+            return columns[column]![i]!.Value<int>();
+        }
+
+        private static double Real(JObject columns, string column, int i)
+        {
+            return columns[column]![i]!.Value<double>();
+        }
+    }
+}
@@ -15,11 +15,18 @@ namespace SimulateurVolFR.Data
         public static DatabaseManager Instance => instance ??= new DatabaseManager();
 
         private string dbPath;
+        private string catalogPath;
         private SQLiteConnection? connection;
 
+        // Catalogue précompilé, utilisé tant qu'il correspond au contenu de la base
+        private const string ContentHashKey = "ContentHash";
+        private CatalogSnapshot? catalog;
+        private bool catalogChecked;
+
         private DatabaseManager()
         {
             dbPath = Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "assets", "data", "simulator.db");
+            catalogPath = Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "assets", "data", "catalog.json");
             EnsureDatabaseExists();
         }
 
@@ -125,6 +132,75 @@ namespace SimulateurVolFR.Data
                     FOREIGN KEY (AirportIcao) REFERENCES Airport(IcaoCode)
                 )";
             cmd.ExecuteNonQuery();
+
+            // Clé naturelle des pistes : un aéroport ne peut avoir deux pistes de même désignation
+            cmd.CommandText = @"
+                CREATE UNIQUE INDEX IF NOT EXISTS IX_Runway_Airport_Designation
+                ON Runway (AirportIcao, Designation)";
+            cmd.ExecuteNonQuery();
+
+            // Métadonnées (empreinte du contenu qui valide le catalogue précompilé)
+            cmd.CommandText = @"
+                CREATE TABLE IF NOT EXISTS Metadata (
+                    Key TEXT PRIMARY KEY,
+                    Value TEXT NOT NULL
+                )";
+            cmd.ExecuteNonQuery();
+        }
+
+        /// <summary>
+        /// Retourne le catalogue précompilé s'il correspond au contenu de la base
+        /// </summary>
+        private CatalogSnapshot? GetCatalog()
+        {
+            if (!catalogChecked)
+            {
+                catalogChecked = true;
+                catalog = CatalogSnapshot.TryLoad(catalogPath, GetContentHash());
+            }
+            return catalog;
+        }
+
+        /// <summary>
+        /// Empreinte du contenu enregistrée par les scripts de remplissage
+        /// </summary>
+        private string? GetContentHash()
+        {
+            try
+            {
+                using var conn = GetConnection();
+                using var cmd = conn.CreateCommand();
+                cmd.CommandText = "SELECT Value FROM Metadata WHERE Key = @Key";
+                cmd.Parameters.AddWithValue("@Key", ContentHashKey);
+                return cmd.ExecuteScalar() as string;
+            }
+            catch (SQLiteException)
+            {
+                // Base antérieure à la table Metadata
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Le contenu a été modifié : le catalogue précompilé n'est plus valable
+        /// </summary>
+        private void InvalidateCatalog()
+        {
+            catalog = null;
+            catalogChecked = true;
+
+            try
+            {
+                using var conn = GetConnection();
+                using var cmd = conn.CreateCommand();
+                cmd.CommandText = "DELETE FROM Metadata WHERE Key = @Key";
+                cmd.Parameters.AddWithValue("@Key", ContentHashKey);
+                cmd.ExecuteNonQuery();
+            }
+            catch (SQLiteException)
+            {
+                // Base antérieure à la table Metadata : aucun catalogue ne peut la valider
+            }
         }
 
         /// <summary>
@@ -391,6 +467,8 @@ namespace SimulateurVolFR.Data
             cmd.Parameters.AddWithValue("@CabinSound", aircraft.CabinSound ?? "");
 
             cmd.ExecuteNonQuery();
+
+            InvalidateCatalog();
         }
 
         /// <summary>
@@ -430,6 +508,8 @@ namespace SimulateurVolFR.Data
             {
                 SaveRunway(airport.IcaoCode, runway);
             }
+
+            InvalidateCatalog();
         }
 
         /// <summary>
@@ -442,7 +522,10 @@ namespace SimulateurVolFR.Data
 
             cmd.CommandText = @"
                 INSERT INTO Runway (AirportIcao, Designation, Length, Width, Surface, HasLights, HasILS)
-                VALUES (@AirportIcao, @Designation, @Length, @Width, @Surface, @HasLights, @HasILS)";
+                VALUES (@AirportIcao, @Designation, @Length, @Width, @Surface, @HasLights, @HasILS)
+                ON CONFLICT (AirportIcao, Designation) DO UPDATE SET
+                    Length = excluded.Length, Width = excluded.Width, Surface = excluded.Surface,
+                    HasLights = excluded.HasLights, HasILS = excluded.HasILS";
 
             cmd.Parameters.AddWithValue("@AirportIcao", airportIcao);
             cmd.Parameters.AddWithValue("@Designation", runway.Designation);
@@ -460,6 +543,12 @@ namespace SimulateurVolFR.Data
         /// </summary>
         public List<Aircraft> GetAllAircraft()
         {
+            var snapshot = GetCatalog();
+            if (snapshot != null)
+            {
+                return snapshot.GetAircraft();
+            }
+
             var aircraft = new List<Aircraft>();
 
             using var conn = GetConnection();
@@ -480,6 +569,13 @@ namespace SimulateurVolFR.Data
         /// </summary>
         public List<Airport> GetAllAirports()
         {
+            var snapshot = GetCatalog();
+            if (snapshot != null)
+            {
+                return snapshot.GetAirports();
+            }
+
+            var runways = GetRunwaysByAirport();
             var airports = new List<Airport>();
 
             using var conn = GetConnection();
@@ -490,7 +586,10 @@ namespace SimulateurVolFR.Data
             while (reader.Read())
             {
                 var airport = ReadAirport(reader);
-                airport.Runways = GetRunwaysForAirport(airport.IcaoCode);
+                if (runways.TryGetValue(airport.IcaoCode, out var airportRunways))
+                {
+                    airport.Runways = airportRunways;
+                }
                 airports.Add(airport);
             }
 
@@ -498,21 +597,26 @@ namespace SimulateurVolFR.Data
         }
 
         /// <summary>
-        /// Récupère les pistes d'un aéroport
+        /// Récupère toutes les pistes en une requête, regroupées par aéroport
         /// </summary>
-        private List<Runway> GetRunwaysForAirport(string icaoCode)
+        private Dictionary<string, List<Runway>> GetRunwaysByAirport()
         {
-            var runways = new List<Runway>();
+            var runways = new Dictionary<string, List<Runway>>();
 
             using var conn = GetConnection();
             using var cmd = conn.CreateCommand();
-            cmd.CommandText = "SELECT * FROM Runway WHERE AirportIcao = @IcaoCode";
-            cmd.Parameters.AddWithValue("@IcaoCode", icaoCode);
+            cmd.CommandText = "SELECT * FROM Runway ORDER BY AirportIcao, Designation";
 
             using var reader = cmd.ExecuteReader();
             while (reader.Read())
             {
-                runways.Add(ReadRunway(reader));
+                string icaoCode = reader.GetString(1);
+                if (!runways.TryGetValue(icaoCode, out var airportRunways))
+                {
+                    airportRunways = new List<Runway>();
+                    runways[icaoCode] = airportRunways;
+                }
+                airportRunways.Add(ReadRunway(reader));
             }
 
             return runways;